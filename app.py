@@ -1,9 +1,15 @@
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import streamlit as st
 import html
 
-from read_resume import safe_extract_text
+from cascade import CascadeConfig, prefilter
+from candidate_store import get_default_store
+from matcher_registry import get_default_registry, get_fitted_matcher
+from keyword_extractor import get_default_extractor
+from read_resume import MAX_UPLOAD_BYTES, UploadTooLargeError, safe_extract, upload_buffer
+from requisitions import score_requisitions
 from resume_builder import (
     build_resume_markdown,
     build_resume_pdf_bytes,
@@ -11,12 +17,35 @@ from resume_builder import (
     get_resume_builder_feedback,
 )
 from smart_builder import generate_smart_builder_suggestions
-from skill_gap import get_skill_match_details
-from svm_model import ATSMatcher
+from skill_gap import JobSkillProfile, SkillMatrix, get_keyword_gap, get_skill_match_details
 from text_cleaner import clean_text
 from video_screening import screen_video_resume
 
 
+BULK_COLUMNS = [
+    "Resume",
+    "ATS Score (%)",
+    "Confidence (%)",
+    "Prediction",
+    "Eliminated At",
+    "Skill Coverage (%)",
+    "Matched Skills",
+    "Missing Skills",
+    "Top Positive Terms",
+    "Top Negative Terms",
+    "Truncated By",
+]
+
+# read_resume budget limits, as shown next to partially read resumes.
+TRUNCATION_LABELS = {"pages": "page limit", "chars": "character limit", "time": "time limit"}
+
+SCORING_ENGINES = {
+    "SVM (default)": None,
+    "Fast Linear": {"engine": "linear"},
+    "Online (learns from feedback)": {"engine": "sgd", "features": "hashing"},
+}
+
+
 st.set_page_config(page_title="ATS Nexus", page_icon="⚡", layout="wide", initial_sidebar_state="expanded")
 
 if "light_mode" not in st.session_state:
@@ -551,6 +580,7 @@ with st.sidebar:
             "Dashboard",
             "Single Resume",
             "Bulk Analysis",
+            "Multi-Requisition",
             "Video Resume",
             "Resume Builder",
         ],
@@ -563,6 +593,7 @@ with st.sidebar:
         height=210,
         placeholder="Paste job description here for ATS scoring...",
     )
+    scoring_engine = st.selectbox("Scoring Engine", list(SCORING_ENGINES), key="sidebar_scoring_engine")
 
 
 def _build_matcher(jd_text: str):
@@ -571,11 +602,10 @@ def _build_matcher(jd_text: str):
     clean_jd_local = clean_text(jd_text)
     if not clean_jd_local:
         return "", None
-    model = ATSMatcher()
-    model.fit(clean_jd_local)
-    return clean_jd_local, model
+    return clean_jd_local, get_fitted_matcher(clean_jd_local, matcher_config)
 
 
+matcher_config = SCORING_ENGINES[scoring_engine]
 clean_jd, matcher = _build_matcher(job_description)
 
 
@@ -586,6 +616,30 @@ def _require_model():
     return True
 
 
+def _add_uploads(files, progress):
+    """
+    Store the uploaded PDFs, reading each upload's buffer in place (no copy).
+    Returns one candidate (or None) per file and the indices of files over the size limit.
+    """
+    items = []
+    oversized = set()
+    for i, file in enumerate(files):
+        try:
+            items.append((file.name, upload_buffer(file)))
+        except UploadTooLargeError:
+            oversized.add(i)
+    stored = iter(get_default_store().add_pdfs(items, progress=progress))
+    return [None if i in oversized else next(stored) for i in range(len(files))], oversized
+
+
+def _truncation_label(truncated_by: str) -> str:
+    return TRUNCATION_LABELS.get(truncated_by, truncated_by)
+
+
+def _format_terms(pairs) -> str:
+    return ", ".join(f"{term} ({value:+.3f})" for term, value in pairs)
+
+
 def _render_smart_suggestion_box(title: str, content: str):
     safe = html.escape(content or "").replace("\n", "<br>")
     st.markdown(
@@ -638,6 +692,7 @@ if nav == "Dashboard":
         1. Paste the **Job Description** in the left sidebar (required for all ATS scoring).
         2. Go to **Single Resume** to upload one PDF and view ATS score, confidence, and matched/missing skills.
         3. Go to **Bulk Analysis** to upload multiple PDFs, rank candidates, and view score heatmaps.
+           Use **Multi-Requisition** to score the same PDFs against several job descriptions and find each candidate's best fit.
         4. Go to **Video Resume** to upload a video CV and evaluate transcript-based ATS fit.
         5. Go to **Resume Builder** to create a resume from scratch and download it as **PDF/MD/TXT**.
         """
@@ -668,14 +723,20 @@ elif nav == "Single Resume":
 
     uploaded_resume = st.file_uploader("Upload Resume (PDF)", type=["pdf"], key="single_pdf")
     if uploaded_resume:
-        raw_text = safe_extract_text(uploaded_resume)
-        if raw_text is None:
+        extracted = safe_extract(uploaded_resume)
+        raw_text = None if extracted is None else extracted.text
+        if uploaded_resume.size > MAX_UPLOAD_BYTES:
+            st.error(f"This PDF is over the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit.")
+        elif raw_text is None:
             st.error("Could not parse this PDF. Please try another file.")
         elif not raw_text.strip():
             st.warning("No readable text found in the uploaded PDF.")
         else:
+            if extracted.truncated_by:
+                st.caption(f"Only part of this PDF was read (stopped at the {_truncation_label(extracted.truncated_by)}).")
             resume_clean = clean_text(raw_text)
-            prediction = matcher.predict_match(resume_clean)
+            explained = matcher.predict_many([resume_clean], explain=8)
+            prediction = explained.row(0)
             skills = get_skill_match_details(clean_jd, resume_clean)
 
             c1, c2, c3 = st.columns(3)
@@ -686,6 +747,12 @@ elif nav == "Single Resume":
 
             st.write(f"Matched Skills: {', '.join(skills['matched_skills']) if skills['matched_skills'] else 'None'}")
             st.write(f"Missing Skills: {', '.join(skills['missing_skills']) if skills['missing_skills'] else 'None'}")
+            # Without a background IDF table, JD "keywords" are just its most frequent words.
+            if get_default_extractor().background is not None:
+                keyword_gap = get_keyword_gap(clean_jd, resume_clean)
+                st.write(f"Missing JD Keywords: {', '.join(keyword_gap['missing_keywords']) or 'None'}")
+            st.write(f"Terms Raising Score: {_format_terms(explained.top_positive[0]) or 'None'}")
+            st.write(f"Terms Lowering Score: {_format_terms(explained.top_negative[0]) or 'None'}")
 
             with st.expander("Extracted Resume Text"):
                 st.write(raw_text[:10000])
@@ -709,42 +776,148 @@ elif nav == "Bulk Analysis":
         accept_multiple_files=True,
         key="bulk_pdf",
     )
+    shortlist_size = st.number_input(
+        "Shortlist size (0 = score every resume)",
+        min_value=0,
+        value=0,
+        step=10,
+        help="For large pools, retrieve the best lexical (BM25) matches from the candidate store and run the ATS model on those only. The rest are listed as not shortlisted.",
+    )
+    with st.expander("Cascade prefilter"):
+        cf1, cf2 = st.columns(2)
+        cascade_config = CascadeConfig(
+            min_token_overlap=cf1.number_input(
+                "Min JD token overlap (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=0.0,
+                step=5.0,
+                help="Share of the job description's words a resume must contain to be scored. 0 disables this stage.",
+            ),
+            min_skill_coverage=cf2.number_input(
+                "Min skill coverage (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=0.0,
+                step=5.0,
+                help="Share of the job description's skills a resume must have to be scored. 0 disables this stage.",
+            ),
+        )
 
     if uploaded_bulk:
         results = []
         progress = st.progress(0.0)
-        total = len(uploaded_bulk)
 
-        for idx, file in enumerate(uploaded_bulk, start=1):
-            raw_text = safe_extract_text(file)
-            if raw_text is None or not raw_text.strip():
+        store = get_default_store()
+        parsed_names = []
+        parsed_keys = []
+        parsed_clean = []
+        parsed_truncated = []
+        # New PDFs are extracted in a process pool; the bar advances as each one finishes.
+        candidates, oversized = _add_uploads(uploaded_bulk, lambda done, n: progress.progress(done / n))
+        for i, (file, candidate) in enumerate(zip(uploaded_bulk, candidates)):
+            if candidate is None or not candidate.raw_text.strip():
                 results.append(
                     {
                         "Resume": file.name,
                         "ATS Score (%)": 0.0,
                         "Confidence (%)": 0.0,
-                        "Prediction": "Parsing Failed",
+                        "Prediction": "Too Large" if i in oversized else "Parsing Failed",
+                        "Eliminated At": "size limit" if i in oversized else "parsing",
+                        "Skill Coverage (%)": 0.0,
                         "Matched Skills": "",
                         "Missing Skills": "",
+                        "Top Positive Terms": "",
+                        "Top Negative Terms": "",
+                        "Truncated By": "",
                     }
                 )
             else:
-                resume_clean = clean_text(raw_text)
-                prediction = matcher.predict_match(resume_clean)
-                skills = get_skill_match_details(clean_jd, resume_clean)
+                parsed_names.append(file.name)
+                parsed_keys.append(candidate.content_hash)
+                parsed_clean.append(candidate.clean_text)
+                parsed_truncated.append(candidate.truncated_by)
+
+        if shortlist_size and len(parsed_clean) > shortlist_size:
+            # BM25 over the stored count vectors; nothing is re-indexed on a rerun.
+            keep = store.shortlist(parsed_keys, clean_jd, int(shortlist_size))
+            kept = set(keep)
+            for i, name in enumerate(parsed_names):
+                if i not in kept:
+                    results.append(
+                        {
+                            "Resume": name,
+                            "ATS Score (%)": 0.0,
+                            "Confidence (%)": 0.0,
+                            "Prediction": "Not Shortlisted",
+                            "Eliminated At": "shortlist",
+                            "Skill Coverage (%)": 0.0,
+                            "Matched Skills": "",
+                            "Missing Skills": "",
+                            "Top Positive Terms": "",
+                            "Top Negative Terms": "",
+                            "Truncated By": _truncation_label(parsed_truncated[i]),
+                        }
+                    )
+            st.caption(f"Scored the top {len(keep)} of {len(parsed_clean)} parsed resumes by BM25 match.")
+            parsed_names = [parsed_names[p] for p in keep]
+            parsed_keys = [parsed_keys[p] for p in keep]
+            parsed_clean = [parsed_clean[p] for p in keep]
+            parsed_truncated = [parsed_truncated[p] for p in keep]
+
+        if cascade_config.enabled and parsed_clean:
+            stage_one = prefilter(clean_jd, parsed_clean, cascade_config)
+            for i in np.flatnonzero(~stage_one.passed):
+                coverage_i = stage_one.skill_coverage[i]
                 results.append(
                     {
-                        "Resume": file.name,
-                        "ATS Score (%)": prediction.score_percent,
-                        "Confidence (%)": prediction.confidence_percent,
-                        "Prediction": prediction.label,
-                        "Matched Skills": ", ".join(skills["matched_skills"]),
-                        "Missing Skills": ", ".join(skills["missing_skills"]),
+                        "Resume": parsed_names[i],
+                        "ATS Score (%)": 0.0,
+                        "Confidence (%)": 0.0,
+                        "Prediction": "Filtered",
+                        "Eliminated At": stage_one.eliminated_at[i],
+                        "Skill Coverage (%)": 0.0 if np.isnan(coverage_i) else float(coverage_i),
+                        "Matched Skills": "",
+                        "Missing Skills": "",
+                        "Top Positive Terms": "",
+                        "Top Negative Terms": "",
+                        "Truncated By": _truncation_label(parsed_truncated[i]),
                     }
                 )
-            progress.progress(idx / total)
+            keep = stage_one.survivors
+            st.caption(f"Cascade prefilter passed {len(keep)} of {len(parsed_clean)} parsed resumes to full scoring.")
+            parsed_names = [parsed_names[p] for p in keep]
+            parsed_keys = [parsed_keys[p] for p in keep]
+            parsed_clean = [parsed_clean[p] for p in keep]
+            parsed_truncated = [parsed_truncated[p] for p in keep]
+
+        # Stored count vectors are re-weighted for the current JD; PDFs are parsed once per content.
+        if parsed_keys:
+            batch = store.score(parsed_keys, matcher, explain=5)
+            jd_profile = JobSkillProfile.from_text(clean_jd)
+            skill_matrix = SkillMatrix.from_texts(parsed_clean)
+            skill_gaps = skill_matrix.gap_lists(jd_profile)
+            coverage = skill_matrix.coverage_percent(jd_profile)
+        else:
+            skill_gaps = []
+        for i, (name, skills) in enumerate(zip(parsed_names, skill_gaps)):
+            results.append(
+                {
+                    "Resume": name,
+                    "ATS Score (%)": float(batch.score_percent[i]),
+                    "Confidence (%)": float(batch.confidence_percent[i]),
+                    "Prediction": batch.label[i],
+                    "Eliminated At": "",
+                    "Skill Coverage (%)": float(coverage[i]),
+                    "Matched Skills": ", ".join(skills["matched_skills"]),
+                    "Missing Skills": ", ".join(skills["missing_skills"]),
+                    "Top Positive Terms": _format_terms(batch.top_positive[i]),
+                    "Top Negative Terms": _format_terms(batch.top_negative[i]),
+                    "Truncated By": _truncation_label(parsed_truncated[i]),
+                }
+            )
 
-        df = pd.DataFrame(results).sort_values(by="ATS Score (%)", ascending=False).reset_index(drop=True)
+        df = pd.DataFrame(results, columns=BULK_COLUMNS).sort_values(by="ATS Score (%)", ascending=False).reset_index(drop=True)
         st.session_state["bulk_results_df"] = df
 
         st.dataframe(df, use_container_width=True)
@@ -799,6 +972,45 @@ elif nav == "Bulk Analysis":
         plt.tight_layout()
         st.pyplot(fig2, use_container_width=True)
 
+        # Nothing was scored (all uploads failed or were filtered out): no skill matrix to chart.
+        pool_coverage = skill_matrix.pool_coverage(jd_profile) if parsed_keys else {}
+        if pool_coverage:
+            st.markdown("#### Pool Skill Coverage")
+            st.caption("Share of scored candidates holding each skill the job description asks for.")
+            cov_items = sorted(pool_coverage.items(), key=lambda item: item[1])
+            fig3, ax3 = plt.subplots(figsize=(12, max(3, min(14, 0.45 * len(cov_items)))))
+            fig3.patch.set_facecolor(chart_bg)
+            ax3.set_facecolor(chart_bg)
+            cov_bars = ax3.barh([k for k, _ in cov_items], [v for _, v in cov_items], color=bar_color, edgecolor=bar_edge)
+            ax3.set_xlim(0, 100)
+            ax3.set_xlabel("Candidates with skill (%)", color=chart_text)
+            ax3.tick_params(colors=chart_text)
+            ax3.grid(axis="x", linestyle="--", alpha=0.25, color=chart_grid)
+            for spine in ax3.spines.values():
+                spine.set_color(chart_grid)
+            for bar, share in zip(cov_bars, [v for _, v in cov_items]):
+                ax3.text(min(share + 1.2, 96), bar.get_y() + bar.get_height() / 2, f"{share:.0f}%", va="center", color=chart_text, fontsize=9)
+            plt.tight_layout()
+            st.pyplot(fig3, use_container_width=True)
+
+        if matcher.engine == "sgd" and parsed_names:
+            st.markdown("#### Recruiter Feedback")
+            st.caption(f"The online model for this JD has absorbed {matcher.feedback_count} feedback decisions.")
+            fb1, fb2 = st.columns(2)
+            shortlisted = fb1.multiselect("Shortlist", parsed_names, key="bulk_feedback_shortlist")
+            rejected = fb2.multiselect(
+                "Reject", [n for n in parsed_names if n not in shortlisted], key="bulk_feedback_reject"
+            )
+            if st.button("Submit Feedback", disabled=not (shortlisted or rejected)):
+                clean_by_name = dict(zip(parsed_names, parsed_clean))
+                get_default_registry().record_feedback(
+                    clean_jd,
+                    [clean_by_name[n] for n in shortlisted + rejected],
+                    [1] * len(shortlisted) + [0] * len(rejected),
+                    matcher_config,
+                )
+                st.rerun()
+
         st.download_button(
             "Download Results CSV",
             data=df.to_csv(index=False).encode("utf-8"),
@@ -808,6 +1020,83 @@ elif nav == "Bulk Analysis":
 
     st.markdown("</div>", unsafe_allow_html=True)
 
+elif nav == "Multi-Requisition":
+    st.markdown("<div class='app-card'>", unsafe_allow_html=True)
+    st.markdown("<h3 class='section-head'>Multi-Requisition Screening</h3>", unsafe_allow_html=True)
+    st.markdown(
+        "<p class='section-sub'>Score one applicant pool against several job descriptions and find each candidate's best-fit requisition.</p>",
+        unsafe_allow_html=True,
+    )
+
+    requisition_rows = st.data_editor(
+        pd.DataFrame([{"Requisition": "Sidebar JD", "Job Description": job_description}]),
+        num_rows="dynamic",
+        use_container_width=True,
+        key="requisition_editor",
+    ).to_dict("records")
+    requisitions = [
+        (str(row.get("Requisition") or "").strip() or f"JD {idx}", clean_text(str(row.get("Job Description") or "")))
+        for idx, row in enumerate(requisition_rows, start=1)
+    ]
+    requisitions = [(req_name, req_jd) for req_name, req_jd in requisitions if req_jd]
+
+    uploaded_multi = st.file_uploader(
+        "Upload Resumes (PDF)",
+        type=["pdf"],
+        accept_multiple_files=True,
+        key="multi_req_pdf",
+    )
+
+    if uploaded_multi and not requisitions:
+        st.warning("Add at least one job description above.")
+    elif uploaded_multi:
+        progress = st.progress(0.0)
+        resume_names = []
+        resumes_clean = []
+        failed = []
+        truncated = []
+        candidates, oversized = _add_uploads(uploaded_multi, lambda done, n: progress.progress(done / n))
+        for i, (file, candidate) in enumerate(zip(uploaded_multi, candidates)):
+            if i in oversized:
+                continue
+            if candidate is None or not candidate.raw_text.strip():
+                failed.append(file.name)
+            else:
+                resume_names.append(file.name)
+                resumes_clean.append(candidate.clean_text)
+                if candidate.truncated_by:
+                    truncated.append(f"{file.name} ({_truncation_label(candidate.truncated_by)})")
+
+        if oversized:
+            st.warning(f"Over the size limit: {', '.join(uploaded_multi[i].name for i in sorted(oversized))}")
+        if failed:
+            st.warning(f"Could not parse: {', '.join(failed)}")
+        if truncated:
+            st.caption(f"Only partly read: {', '.join(truncated)}")
+
+        if resumes_clean:
+            matrix = score_requisitions(
+                [req_jd for _, req_jd in requisitions],
+                resumes_clean,
+                requisition_names=[req_name for req_name, _ in requisitions],
+                resume_names=resume_names,
+                config=matcher_config,
+            )
+            multi_df = (
+                pd.DataFrame(matrix.best_fit_rows())
+                .sort_values(by="Best Fit Score (%)", ascending=False)
+                .reset_index(drop=True)
+            )
+            st.dataframe(multi_df, use_container_width=True)
+            st.download_button(
+                "Download Best-Fit CSV",
+                data=multi_df.to_csv(index=False).encode("utf-8"),
+                file_name="ats_multi_requisition_results.csv",
+                mime="text/csv",
+            )
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
 elif nav == "Video Resume":
     if not _require_model():
         st.stop()
@@ -825,7 +1114,9 @@ elif nav == "Video Resume":
 
         if run and uploaded_video:
             with st.spinner("Processing video and transcribing audio..."):
-                result = screen_video_resume(uploaded_video.read(), job_description, video_name=uploaded_video.name)
+                result = screen_video_resume(
+                    uploaded_video.read(), job_description, video_name=uploaded_video.name, config=matcher_config
+                )
 
             st.markdown(
                 f"""
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+TermContributions = List[List[Tuple[str, float]]]
+
+
+@dataclass
+class PredictionResult:
+    label: str
+    score_percent: float
+    confidence_percent: float
+
+
+@dataclass
+class BatchPrediction:
+    """Columnar prediction results; row i belongs to the i-th input resume."""
+
+    label: np.ndarray
+    score_percent: np.ndarray
+    confidence_percent: np.ndarray
+    top_positive: Optional[TermContributions] = None
+    top_negative: Optional[TermContributions] = None
+
+    def __len__(self) -> int:
+        return len(self.score_percent)
+
+    def row(self, index: int) -> PredictionResult:
+        return PredictionResult(
+            label=str(self.label[index]),
+            score_percent=float(self.score_percent[index]),
+            confidence_percent=float(self.confidence_percent[index]),
+        )
+
+
+def sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def batch_from_probs(pos_prob: np.ndarray) -> BatchPrediction:
+    """Turn match probabilities into rounded scores, confidences and labels."""
+    pos_prob = np.asarray(pos_prob, dtype=float)
+    score = np.round(pos_prob * 100, 2)
+    confidence = np.round(np.maximum(pos_prob, 1.0 - pos_prob) * 100, 2)
+    label = np.where(score >= 50, "Matched", "Not Matched").astype(object)
+    return BatchPrediction(label=label, score_percent=score, confidence_percent=confidence)
+
+
+def _libsvm_binary_coupling(pairwise: np.ndarray) -> np.ndarray:
+    """
+    libsvm's multiclass_probability for k=2, vectorized over rows.
+
+    `pairwise` is the clipped sigmoid output for the first class. libsvm does
+    not return it directly but refines it iteratively (eps = 0.005 / k), which
+    can move the probability by up to ~0.5 points; replicating the loop keeps
+    exported scores identical to SVC.predict_proba. Returns P(second class).
+    """
+    r01 = pairwise
+    r10 = 1.0 - pairwise
+    q00 = r10 * r10
+    q11 = r01 * r01
+    q01 = -r10 * r01
+    p0 = np.full(len(pairwise), 0.5)
+    p1 = np.full(len(pairwise), 0.5)
+    active = np.ones(len(pairwise), dtype=bool)
+    for _ in range(100):
+        qp0 = q00 * p0 + q01 * p1
+        qp1 = q01 * p0 + q11 * p1
+        pqp = p0 * qp0 + p1 * qp1
+        active &= np.maximum(np.abs(qp0 - pqp), np.abs(qp1 - pqp)) >= 0.0025
+        if not active.any():
+            break
+
+        diff = np.where(active, (pqp - qp0) / q00, 0.0)
+        new_p0 = (p0 + diff) / (1 + diff)
+        new_p1 = p1 / (1 + diff)
+        pqp = (pqp + diff * (diff * q00 + 2 * qp0)) / (1 + diff) / (1 + diff)
+        qp1 = (qp1 + diff * q01) / (1 + diff)
+
+        diff = np.where(active, (pqp - qp1) / q11, 0.0)
+        new_p1 = (new_p1 + diff) / (1 + diff)
+        new_p0 = new_p0 / (1 + diff)
+        p0 = np.where(active, new_p0, p0)
+        p1 = np.where(active, new_p1, p1)
+    return p1
+
+
+def calibrate(decision: np.ndarray, prob_a: float, prob_b: float, method: str = "sigmoid") -> np.ndarray:
+    """
+    P(match) from linear decision values.
+
+    "sigmoid" is sigmoid(prob_a * decision + prob_b); "libsvm" additionally
+    applies libsvm's clipping and binary pairwise coupling, as SVC does.
+    """
+    pos = sigmoid(prob_a * np.asarray(decision, dtype=float) + prob_b)
+    if method == "sigmoid":
+        return pos
+    if method == "libsvm":
+        return _libsvm_binary_coupling(np.clip(1.0 - pos, 1e-7, 1 - 1e-7))
+    raise ValueError(f"Unknown calibration method {method!r}.")
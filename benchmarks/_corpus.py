@@ -0,0 +1,40 @@
+"""Deterministic synthetic JD/resume text shared by the benchmark scripts."""
+
+import random
+from typing import List
+
+JOB_DESCRIPTION = (
+    "We are hiring a Data Scientist with strong Python, SQL, machine learning, scikit-learn, "
+    "pandas, AWS and Docker experience. Communication and stakeholder management skills are "
+    "required. You will build NLP models, deploy them with Kubernetes and report results in "
+    "Tableau dashboards for the product team."
+)
+
+_RELEVANT = (
+    "python sql machine learning scikit-learn pandas aws docker kubernetes nlp tableau "
+    "communication stakeholder management data analysis deep learning statistics models "
+    "dashboards deployed pipelines"
+).split()
+
+_GENERIC = (
+    "managed team project budget retail customer sales marketing java react node frontend "
+    "backend finance accounting operations logistics support delivered improved reduced "
+    "increased coordinated responsible weekly reports clients training hiring quality"
+).split()
+
+
+def make_resumes(
+    n: int, seed: int = 7, min_words: int = 150, max_words: int = 600, max_relevance: float = 1.0
+) -> List[str]:
+    """Raw resume-like texts with a varying share (up to `max_relevance`) of JD-relevant vocabulary."""
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(n):
+        relevance = rng.random() * max_relevance
+        length = rng.randint(min_words, max_words)
+        words = [
+            rng.choice(_RELEVANT) if rng.random() < relevance * 0.5 else rng.choice(_GENERIC)
+            for _ in range(length)
+        ]
+        docs.append(" ".join(words))
+    return docs
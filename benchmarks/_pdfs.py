@@ -0,0 +1,54 @@
+"""Generated text-only resume PDFs (matplotlib) for the extraction benchmarks."""
+
+import io
+import random
+import textwrap
+from typing import List
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_pdf import PdfPages
+
+from benchmarks._corpus import make_resumes
+
+LINES_PER_PAGE = 48
+
+
+def make_pdf(text: str, title: str = "Candidate Resume", shuffled: bool = False, photo_kb: int = 0) -> bytes:
+    """
+    Single-column A4 PDF with `text` wrapped at 95 characters, paginated.
+    `shuffled` draws each page's lines in random order, so the content stream
+    is not in reading order even though the rendered page is. `photo_kb` adds
+    an incompressible RGB image of about that size to the first page, as a
+    stand-in for a headshot or scanned logo.
+    """
+    lines = [title, ""] + textwrap.wrap(text, 95)
+    rng = random.Random(len(text))
+    out = io.BytesIO()
+    with PdfPages(out) as pdf:
+        for start in range(0, len(lines), LINES_PER_PAGE):
+            fig = plt.figure(figsize=(8.27, 11.69))
+            if photo_kb and start == 0:
+                side = int((photo_kb * 1024 / 3) ** 0.5)
+                pixels = np.random.default_rng(len(text)).integers(0, 256, (side, side, 3), dtype=np.uint8)
+                fig.figimage(pixels, xo=560, yo=1000)
+            rows = list(enumerate(lines[start:start + LINES_PER_PAGE]))
+            if shuffled:
+                rng.shuffle(rows)
+            for row, line in rows:
+                fig.text(0.06, 0.95 - row * 0.019, line, fontsize=9, family="DejaVu Sans")
+            pdf.savefig(fig)
+            plt.close(fig)
+    return out.getvalue()
+
+
+def make_pdfs(
+    n: int,
+    seed: int = 7,
+    min_words: int = 300,
+    max_words: int = 1200,
+    shuffled: bool = False,
+    photo_kb: int = 0,
+) -> List[bytes]:
+    docs = make_resumes(n, seed, min_words, max_words)
+    return [make_pdf(doc, f"Candidate {i}", shuffled, photo_kb) for i, doc in enumerate(docs)]
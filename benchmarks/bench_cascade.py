@@ -0,0 +1,91 @@
+"""
+Cascade screening vs full scoring: throughput, share of the pool that reaches
+the ATS model, and recall of full scoring's "Matched" candidates.
+
+"Full" is what Bulk Analysis does per resume: ATSMatcher.predict_many plus
+skill extraction for the gap columns. The cascade pays for the prefilter on
+every resume and for both of those on survivors only.
+
+The pool mixes ordinary synthetic resumes with --miss-share applicants drawn
+with almost no JD vocabulary, as in a high-volume requisition.
+
+    python -m benchmarks.bench_cascade --resumes 5000 --miss-share 0.8
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from benchmarks._corpus import JOB_DESCRIPTION, make_resumes
+from cascade import CascadeConfig, cascade_predict
+from skill_gap import JobSkillProfile, SkillMatrix, skill_cache
+from svm_model import ATSMatcher
+from text_cleaner import clean_text
+
+CONFIGS = [
+    CascadeConfig(min_token_overlap=30),
+    CascadeConfig(min_token_overlap=50),
+    CascadeConfig(min_skill_coverage=50),
+    CascadeConfig(min_token_overlap=30, min_skill_coverage=60),
+    CascadeConfig(min_token_overlap=50, min_skill_coverage=70),
+]
+
+
+def _full(matcher, jd_clean, resumes):
+    batch = matcher.predict_many(resumes)
+    SkillMatrix.from_texts(resumes).gap_lists(JobSkillProfile.from_text(jd_clean))
+    return batch
+
+
+def _cascade(matcher, jd_clean, resumes, config):
+    result, batch = cascade_predict(matcher, jd_clean, resumes, config)
+    survivors = [resumes[i] for i in result.survivors]
+    SkillMatrix.from_texts(survivors).gap_lists(JobSkillProfile.from_text(jd_clean))
+    return result, batch
+
+
+def _timed(fn, repeats):
+    best, out = float("inf"), None
+    for _ in range(repeats):
+        skill_cache.clear()
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=5000)
+    parser.add_argument("--miss-share", type=float, default=0.8)
+    parser.add_argument("--engine", default="svm")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    jd_clean = clean_text(JOB_DESCRIPTION)
+    n_miss = int(args.resumes * args.miss_share)
+    pool = make_resumes(args.resumes - n_miss) + make_resumes(n_miss, seed=8, max_relevance=0.15)
+    resumes = [clean_text(doc) for doc in pool]
+    matcher = ATSMatcher(engine=args.engine)
+    matcher.fit(jd_clean)
+
+    full_s, full = _timed(lambda: _full(matcher, jd_clean, resumes), args.repeats)
+    relevant = full.label == "Matched"
+    print(f"{len(resumes)} resumes, {int(relevant.sum())} Matched by full scoring, full pass {full_s * 1e3:.1f} ms")
+    print(f"{'overlap%':>8} {'skills%':>8} {'scored':>8} {'time (ms)':>10} {'speedup':>8} {'recall':>7}")
+    for config in CONFIGS:
+        cascade_s, (result, batch) = _timed(lambda: _cascade(matcher, jd_clean, resumes, config), args.repeats)
+        kept = np.zeros(len(resumes), dtype=bool)
+        kept[result.survivors[batch.label == "Matched"]] = True
+        recall = (kept & relevant).sum() / max(int(relevant.sum()), 1)
+        print(
+            f"{config.min_token_overlap:>8.0f} {config.min_skill_coverage:>8.0f} "
+            f"{result.passed.mean() * 100:>7.1f}% {cascade_s * 1e3:>10.1f} {full_s / cascade_s:>7.2f}x {recall * 100:>6.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Worker cold start: unpickling a fitted ATSMatcher vs loading an exported model
+with fast_scorer (NumPy only). Each measurement runs in a fresh interpreter.
+
+    python -m benchmarks.bench_cold_start --runs 5
+"""
+
+import argparse
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import warnings
+
+import numpy as np
+
+from benchmarks._corpus import JOB_DESCRIPTION
+from svm_model import ATSMatcher
+from text_cleaner import clean_text
+
+_PICKLE_WORKER = """
+import time
+start = time.perf_counter()
+import pickle
+with open({path!r}, "rb") as fh:
+    model = pickle.load(fh)
+model.predict_match("python sql machine learning")
+print(time.perf_counter() - start)
+"""
+
+_EXPORT_WORKER = """
+import time
+start = time.perf_counter()
+from fast_scorer import ExportedScorer
+model = ExportedScorer.load({path!r})
+model.predict_match("python sql machine learning")
+print(time.perf_counter() - start)
+"""
+
+
+def _run(code: str, runs: int) -> float:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", code], cwd=root, check=True, capture_output=True, text=True
+        )
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'engine':<8} {'pickle (ms)':>12} {'export (ms)':>12}")
+        for engine in ("svm", "linear"):
+            model = ATSMatcher(engine=engine)
+            model.fit(clean_text(JOB_DESCRIPTION))
+            pickle_path = os.path.join(tmp, f"{engine}.pkl")
+            with open(pickle_path, "wb") as fh:
+                pickle.dump(model, fh)
+            export_path = os.path.join(tmp, engine)
+            model.export(export_path)
+
+            pickled = _run(_PICKLE_WORKER.format(path=pickle_path), args.runs)
+            exported = _run(_EXPORT_WORKER.format(path=export_path), args.runs)
+            print(f"{engine:<8} {pickled * 1e3:>12.1f} {exported * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
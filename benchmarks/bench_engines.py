@@ -0,0 +1,80 @@
+"""
+Compare the "svm" and "linear" ATSMatcher engines, then time recruiter
+feedback on the online engine (sgd + hashing) and check that explanations
+still work on buckets only feedback resumes have weighted.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_engines --resumes 2000
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from benchmarks._corpus import JOB_DESCRIPTION, make_resumes
+from candidate_store import CandidateStore
+from svm_model import ATSMatcher
+from text_cleaner import clean_text
+
+
+def _time_fit(engine: str, jd_clean: str, repeats: int):
+    timings = []
+    model = None
+    for _ in range(repeats):
+        model = ATSMatcher(engine=engine)
+        start = time.perf_counter()
+        model.fit(jd_clean)
+        timings.append(time.perf_counter() - start)
+    return model, float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    jd_clean = clean_text(JOB_DESCRIPTION)
+    resumes = [clean_text(doc) for doc in make_resumes(args.resumes)]
+
+    scores = {}
+    print(f"{'engine':<8} {'fit (ms)':>10} {'score (ms)':>11} {'us/resume':>10}")
+    for engine in ("svm", "linear"):
+        model, fit_s = _time_fit(engine, jd_clean, args.repeats)
+        start = time.perf_counter()
+        batch = model.predict_many(resumes)
+        score_s = time.perf_counter() - start
+        scores[engine] = batch
+        print(f"{engine:<8} {fit_s * 1e3:>10.2f} {score_s * 1e3:>11.2f} {score_s / len(resumes) * 1e6:>10.1f}")
+
+    svm, linear = scores["svm"], scores["linear"]
+    pearson = np.corrcoef(svm.score_percent, linear.score_percent)[0, 1]
+    rank_corr = np.corrcoef(np.argsort(np.argsort(svm.score_percent)), np.argsort(np.argsort(linear.score_percent)))[0, 1]
+    print()
+    print(f"score agreement: pearson={pearson:.4f} spearman={rank_corr:.4f}")
+    print(f"mean |score diff|: {np.abs(svm.score_percent - linear.score_percent).mean():.2f} points")
+    print(f"label agreement: {(svm.label == linear.label).mean() * 100:.1f}%")
+
+    online = ATSMatcher(engine="sgd", features="hashing")
+    online.fit(jd_clean)
+    feedback = resumes[:50]
+    start = time.perf_counter()
+    online.partial_fit(feedback, [i % 2 for i in range(len(feedback))])
+    feedback_s = time.perf_counter() - start
+    explained = online.predict_many(resumes[:20], explain=3)
+    store = CandidateStore()
+    for i, text in enumerate(resumes[:20]):
+        store.add_text(str(i), str(i), text)
+    stored = store.score([str(i) for i in range(20)], online, explain=3)
+    assert explained.top_positive is not None and stored.top_positive is not None
+    # The store hashes only the terms of the rows it scores, and names them.
+    assert stored.top_positive == explained.top_positive and stored.top_negative == explained.top_negative
+    print(f"online feedback: {len(feedback)} resumes in {feedback_s * 1e3:.2f} ms, explanations ok")
+
+
+if __name__ == "__main__":
+    main()
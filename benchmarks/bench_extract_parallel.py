@@ -0,0 +1,54 @@
+"""
+Bulk PDF extraction: serial extract_text_from_pdf vs read_resume.extract_many
+with a process pool, on generated multi-page PDFs. Pool timings include
+worker start-up and recycling (--tasks-per-worker). "auto" uses the worker
+count read_resume.pool_workers picks for the batch, as CandidateStore.add_pdfs
+does (serial for small batches). The extraction cache is switched off so
+every run parses every file.
+
+    python -m benchmarks.bench_extract_parallel --pdfs 120 --workers 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks._pdfs import make_pdfs
+from extraction_cache import CACHE_PATH_ENV
+from read_resume import extract_many, extract_text_from_pdf, pool_workers
+
+os.environ[CACHE_PATH_ENV] = "off"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=120)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    parser.add_argument("--tasks-per-worker", type=int, default=50)
+    args = parser.parse_args()
+
+    pdfs = make_pdfs(args.pdfs)
+    total_mb = sum(len(p) for p in pdfs) / 1e6
+
+    start = time.perf_counter()
+    serial = [extract_text_from_pdf(p) for p in pdfs]
+    serial_s = time.perf_counter() - start
+    print(f"{len(pdfs)} PDFs, {total_mb:.1f} MB, {os.cpu_count()} CPUs")
+    print(f"{'mode':<12} {'time (s)':>9} {'files/s':>9} {'speedup':>8}")
+    print(f"{'serial':<12} {serial_s:>9.2f} {len(pdfs) / serial_s:>9.1f} {1.0:>7.2f}x")
+
+    for workers in sorted(set(args.workers)) + [None]:
+        start = time.perf_counter()
+        label = f"{workers} workers"
+        if workers is None:
+            workers = pool_workers(pdfs)
+            label = f"auto ({workers})"
+        results = list(extract_many(enumerate(pdfs), max_workers=workers, max_tasks_per_child=args.tasks_per_worker))
+        pool_s = time.perf_counter() - start
+        texts = {r.key: r.text for r in results}
+        assert [texts[i] for i in range(len(pdfs))] == serial, "pool output differs from serial extraction"
+        print(f"{label:<12} {pool_s:>9.2f} {len(pdfs) / pool_s:>9.1f} {serial_s / pool_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
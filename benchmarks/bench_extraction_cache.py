@@ -0,0 +1,53 @@
+"""
+Persistent extraction cache: a cold batch (every PDF parsed, text cached) vs
+the same batch re-uploaded in a later session (every PDF a cache hit), plus
+the on-disk footprint of the compressed text.
+
+    python -m benchmarks.bench_extraction_cache --pdfs 40
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks._pdfs import make_pdfs
+from extraction_cache import ExtractionCache
+import read_resume
+
+
+def _run(pdfs):
+    start = time.perf_counter()
+    results = list(read_resume.extract_many(enumerate(pdfs), max_workers=1))
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=40)
+    args = parser.parse_args()
+
+    pdfs = make_pdfs(args.pdfs)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.sqlite3")
+        cache = ExtractionCache(path)
+        read_resume.get_default_extraction_cache = lambda: cache
+        cold_s, cold = _run(pdfs)
+
+        # A new session: fresh connection to the same file.
+        cache.close()
+        cache = ExtractionCache(path)
+        warm_s, warm = _run(pdfs)
+        assert [r.text for r in warm] == [r.text for r in cold]
+
+        stats = cache.stats()
+        raw_chars = sum(len(r.text) for r in cold)
+        print(f"{len(pdfs)} PDFs, {sum(map(len, pdfs)) / 1e6:.1f} MB, {raw_chars / 1e3:.0f}k chars of text")
+        print(f"cold  {cold_s:8.3f} s  {len(pdfs) / cold_s:9.1f} files/s")
+        print(f"warm  {warm_s:8.3f} s  {len(pdfs) / warm_s:9.1f} files/s  ({cold_s / warm_s:.0f}x)")
+        print(f"cache {stats['entries']} rows, {stats['bytes'] / 1e3:.0f} kB compressed text, {stats['hits']} hits")
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+One oversized "resume" (an attached portfolio) through extraction + cleaning:
+the whole document vs a budgeted PageStream feeding clean_pages. Reports time,
+Python peak allocation (tracemalloc) and how much of the document was read.
+
+    python -m benchmarks.bench_page_stream --words 25000
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+
+from pdfminer.pdfpage import PDFPage
+
+from benchmarks._corpus import make_resumes
+from benchmarks._pdfs import make_pdf
+from read_resume import DEFAULT_BUDGET, ExtractionBudget, PageStream, extract_text_from_pdf
+from text_cleaner import clean_pages, clean_text
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=25000)
+    args = parser.parse_args()
+
+    pdf = make_pdf(" ".join(make_resumes(max(args.words // 1000, 1), 3, 1000, 1000)), "Portfolio")
+    n_pages = sum(1 for _ in PDFPage.get_pages(io.BytesIO(pdf)))
+    print(f"{len(pdf) / 1e6:.2f} MB PDF, {n_pages} pages")
+    print(f"{'mode':<22} {'time (s)':>9} {'peak (MB)':>10} {'pages':>6} {'truncated':>10}")
+
+    elapsed, peak, _ = _measure(lambda: clean_text(extract_text_from_pdf(pdf)))
+    print(f"{'whole document':<22} {elapsed:>9.2f} {peak / 1e6:>10.1f} {n_pages:>6} {'':>10}")
+    budgets = [("stream, no budget", ExtractionBudget()), ("stream, default budget", DEFAULT_BUDGET)]
+    for label, budget in budgets:
+        stream = PageStream(pdf, budget)
+        elapsed, peak, _ = _measure(lambda: clean_pages(stream))
+        print(f"{label:<22} {elapsed:>9.2f} {peak / 1e6:>10.1f} {stream.pages_read:>6} {stream.truncated_by:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+PDF text extraction backends on generated PDFs: pages/second and agreement
+with pdfplumber (token-sequence similarity, 1.0 = identical words in the same
+order). "auto" is the default chain: stream walker, pdfplumber on failure.
+
+The corpus mixes ordinary single-column PDFs with --shuffled PDFs whose lines
+are drawn out of order, which the stream walker must detect and hand over.
+
+    python -m benchmarks.bench_pdf_backends --pdfs 60 --shuffled 10
+"""
+
+import argparse
+import difflib
+import io
+import time
+
+from pdfminer.pdfpage import PDFPage
+
+from benchmarks._pdfs import make_pdfs
+from read_resume import DEFAULT_BACKENDS, EXTRACTION_BACKENDS, extract_text_from_pdf
+
+
+def _agreement(text: str, reference: str) -> float:
+    return difflib.SequenceMatcher(None, text.split(), reference.split(), autojunk=False).ratio()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=60)
+    parser.add_argument("--shuffled", type=int, default=10)
+    args = parser.parse_args()
+
+    pdfs = make_pdfs(args.pdfs) + make_pdfs(args.shuffled, seed=9, shuffled=True)
+    pages = sum(sum(1 for _ in PDFPage.get_pages(io.BytesIO(p))) for p in pdfs)
+    reference = [extract_text_from_pdf(p, ("pdfplumber",)) for p in pdfs]
+
+    print(f"{len(pdfs)} PDFs ({args.shuffled} with shuffled draw order), {pages} pages")
+    print(f"{'backend':<12} {'pages/s':>9} {'agreement':>10} {'failed':>7}")
+    runs = [(name, lambda p, name=name: extract_text_from_pdf(p, (name,))) for name in EXTRACTION_BACKENDS]
+    runs.append(("auto", lambda p: extract_text_from_pdf(p, DEFAULT_BACKENDS)))
+    for name, fn in runs:
+        texts, failed = [], 0
+        start = time.perf_counter()
+        for pdf in pdfs:
+            try:
+                texts.append(fn(pdf))
+            except Exception:
+                texts.append("")
+                failed += 1
+        elapsed = time.perf_counter() - start
+        agreement = sum(_agreement(t, r) for t, r in zip(texts, reference)) / len(pdfs)
+        print(f"{name:<12} {pages / elapsed:>9.1f} {agreement:>10.4f} {failed:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Skill extraction with the compiled SkillMatcher vs the original per-phrase
+regex/substring scan, on the bundled taxonomy and on a synthetic taxonomy
+of --skills entries. Results are checked for equality on every document.
+Also times load_taxonomy for the synthetic file: compile vs cached load.
+
+    python -m benchmarks.bench_skill_matcher --resumes 200 --skills 10000
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+import time
+
+from benchmarks._corpus import JOB_DESCRIPTION, make_resumes
+from skill_matcher import SkillMatcher
+from skill_taxonomy import get_default_taxonomy, load_taxonomy
+from text_cleaner import clean_text
+
+
+def _scan_skills(text, skill_set, phrases, aliases):
+    """The original skill_gap._tokenize_skills, parameterized by taxonomy."""
+    text_l = text.lower()
+    matched = set()
+    tokens = re.findall(r"[a-zA-Z0-9+#.-]+", text_l)
+    token_set = set(tokens)
+    joined = "".join(tokens)
+    for phrase in phrases:
+        words = phrase.split()
+        exact_phrase = bool(re.search(rf"\b{re.escape(phrase)}\b", text_l))
+        all_words_present = all(w in token_set for w in words)
+        merged_present = "".join(words) in joined
+        if exact_phrase or all_words_present or merged_present:
+            matched.add(phrase)
+    token_matches = {t for t in tokens if t in skill_set}
+    for token in token_set:
+        if token in aliases:
+            matched.add(aliases[token])
+    phrase_parts = set()
+    for phrase in matched:
+        phrase_parts.update(phrase.split())
+    token_matches -= phrase_parts
+    return matched | token_matches
+
+
+def _synthetic_taxonomy(n_skills: int, seed: int = 11):
+    """Mix of corpus words (so phrases really fire) and random made-up terms."""
+    rng = random.Random(seed)
+    vocab = sorted(set(" ".join(make_resumes(50, seed=seed)).split()))
+
+    def word():
+        if rng.random() < 0.3:
+            return rng.choice(vocab)
+        return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789+#.-") for _ in range(rng.randint(2, 9)))
+
+    skills = {word() for _ in range(n_skills // 2)}
+    phrases = {" ".join(word() for _ in range(rng.randint(2, 3))) for _ in range(n_skills - len(skills))}
+    # Characters outside the token alphabet exercise the regex fallback.
+    phrases.update({"c/c++ programming", "r&d", "ml/ai"})
+    aliases = {word(): rng.choice(sorted(phrases)) for _ in range(n_skills // 20)}
+    return skills, phrases, aliases
+
+
+def _taxonomy_inputs(taxonomy):
+    names = set(taxonomy.entries)
+    aliases = {alias: e.name for e in taxonomy.entries.values() for alias in e.aliases}
+    return {n for n in names if " " not in n}, {n for n in names if " " in n}, aliases
+
+
+def _time_load(taxonomy):
+    skills, phrases, aliases = taxonomy
+    targets = {}
+    for alias, name in aliases.items():
+        targets.setdefault(name, []).append(alias)
+    rows = [{"name": n, "aliases": targets.get(n, [])} for n in sorted(skills | phrases)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "taxonomy.json")
+        with open(path, "w") as fh:
+            json.dump({"skills": rows}, fh)
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            load_taxonomy(path, cache_dir=tmp)
+            timings.append(time.perf_counter() - start)
+    print(f"load_taxonomy ({len(rows)} skills)  compile {timings[0] * 1000:7.1f} ms  cached {timings[1] * 1000:6.1f} ms")
+
+
+def _run(label, docs, taxonomy, baseline_docs):
+    skills, phrases, aliases = taxonomy
+    start = time.perf_counter()
+    matcher = SkillMatcher(skills, phrases, aliases)
+    compile_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = [matcher.extract(doc) for doc in docs]
+    fast_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slow = [_scan_skills(doc, skills, phrases, aliases) for doc in docs[:baseline_docs]]
+    slow_s = time.perf_counter() - start
+
+    assert fast[:baseline_docs] == slow, f"{label}: SkillMatcher disagrees with the original scan"
+    print(
+        f"{label:<22} {len(skills) + len(phrases) + len(aliases):>6} entries  compile {compile_s * 1000:7.1f} ms  "
+        f"scan {slow_s / len(slow) * 1000:8.3f} ms/doc  matcher {fast_s / len(fast) * 1000:6.3f} ms/doc  "
+        f"({matcher.n_states} states)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--skills", type=int, default=10000)
+    parser.add_argument("--baseline-docs", type=int, default=20, help="Docs run through the slow original scan.")
+    args = parser.parse_args()
+
+    # Raw text first (always checked): tokenization and the phrase regex treat punctuation differently.
+    docs = [JOB_DESCRIPTION, "Machine-Learning, ML/AI; machine learning. dataanalysis problem-solving C/C++ R&D node.js"]
+    docs += [clean_text(JOB_DESCRIPTION)] + [clean_text(doc) for doc in make_resumes(args.resumes)]
+
+    _run("bundled taxonomy", docs, _taxonomy_inputs(get_default_taxonomy()), len(docs))
+    synthetic = _synthetic_taxonomy(args.skills)
+    _run("synthetic taxonomy", docs, synthetic, args.baseline_docs)
+    _time_load(synthetic)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Throughput of text_cleaner.clean_text / clean_texts against the previous
+two-regex implementation, with an output-equality check. The memo cache is
+cleared before each timed pass except in the "memo" row (all repeats hit).
+
+    python -m benchmarks.bench_text_cleaner --resumes 500
+"""
+
+import argparse
+import re
+import time
+
+from benchmarks._corpus import make_resumes
+from text_cleaner import _get_stopwords, clean_text, clean_text_cache, clean_texts
+
+
+def _regex_clean_text(text: str) -> str:
+    """The original regex-based normalizer, kept here as the baseline."""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9\s]", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    sw = _get_stopwords()
+    return " ".join(tok for tok in text.split() if tok not in sw and len(tok) > 1)
+
+
+def _messy(doc: str, index: int) -> str:
+    """Add the punctuation, casing and Unicode that real PDF text carries."""
+    return f"Résumé #{index}:\tC++/C# — {doc.title()}, e-mail: a.b@x.io; naïve café (2019–2024)!\n" * 3 + doc
+
+
+def _throughput(fn, docs, total_mb: float, repeats: int, warm: bool = False) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        if not warm:
+            clean_text_cache.clear()
+        start = time.perf_counter()
+        fn(docs)
+        best = min(best, time.perf_counter() - start)
+    return total_mb / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    docs = [_messy(doc, i) for i, doc in enumerate(make_resumes(args.resumes, min_words=1500, max_words=3000))]
+    total_mb = sum(len(doc.encode("utf-8")) for doc in docs) / 1e6
+    _get_stopwords()
+
+    baseline = [_regex_clean_text(doc) for doc in docs]
+    assert [clean_text(doc) for doc in docs] == baseline, "clean_text output changed"
+    assert list(clean_texts(docs)) == baseline, "clean_texts output changed"
+
+    results = {
+        "regex baseline": _throughput(lambda d: [_regex_clean_text(x) for x in d], docs, total_mb, args.repeats),
+        "clean_text": _throughput(lambda d: [clean_text(x) for x in d], docs, total_mb, args.repeats),
+        "clean_texts": _throughput(lambda d: list(clean_texts(d)), docs, total_mb, args.repeats),
+        "clean_text (memo)": _throughput(lambda d: [clean_text(x) for x in d], docs, total_mb, args.repeats, warm=True),
+    }
+    print(f"{len(docs)} documents, {total_mb:.1f} MB, outputs identical")
+    for name, mb_s in results.items():
+        print(f"{name:<18} {mb_s:>8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
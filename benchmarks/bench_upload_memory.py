@@ -0,0 +1,101 @@
+"""
+Peak RSS of one Bulk Analysis batch by upload read path: getvalue() (what
+the app called before), a memoryview from getbuffer(), and
+read_resume.upload_buffer (size-checked, then getvalue()). Streamlit uploads
+are BytesIO objects built from the received bytes: getvalue() returns those
+bytes as they are, while getbuffer() makes the BytesIO copy them first.
+
+Each mode runs in a fresh interpreter that holds the uploads as in-memory
+BytesIO objects, as Streamlit does, then stores them with
+CandidateStore.add_pdfs. Extraction is serial (workers are separate processes
+with their own RSS) and the extraction cache is off, so every file is parsed.
+Peak RSS is read from /proc (Linux only), reset after the uploads are loaded.
+PDFs carry a --photo-kb image so they have realistic upload sizes.
+
+    python -m benchmarks.bench_upload_memory --files 500 --photo-kb 300
+"""
+
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = ("getvalue", "getbuffer", "upload_buffer")
+
+
+def _status_kb(field: str) -> int:
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise KeyError(field)
+
+
+def _child(mode: str, directory: str):
+    os.environ["ATS_EXTRACTION_CACHE"] = "off"
+    from candidate_store import CandidateStore
+    from read_resume import upload_buffer
+
+    # Streamlit keeps each upload's bytes in its file manager and wraps them in
+    # a BytesIO per script run; `records` plays the file manager.
+    records = []
+    uploads = []
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), "rb") as fh:
+            records.append(fh.read())
+        upload = io.BytesIO(records[-1])
+        upload.name = name
+        uploads.append(upload)
+    loaded_kb = _status_kb("VmRSS")
+    # Reset the peak-RSS mark so import-time spikes do not hide the batch's own peak.
+    with open("/proc/self/clear_refs", "w") as fh:
+        fh.write("5")
+
+    start = time.perf_counter()
+    if mode == "getvalue":
+        items = [(f.name, f.getvalue()) for f in uploads]
+    elif mode == "getbuffer":
+        items = [(f.name, f.getbuffer()) for f in uploads]
+    else:
+        items = [(f.name, upload_buffer(f)) for f in uploads]
+    stored = CandidateStore().add_pdfs(items, max_workers=1)
+    elapsed = time.perf_counter() - start
+    peak_kb = _status_kb("VmHWM")
+    print(f"{mode} {loaded_kb} {peak_kb} {elapsed:.2f} {sum(c is not None for c in stored)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--photo-kb", type=int, default=300)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(*args.child)
+        return
+
+    from benchmarks._pdfs import make_pdfs
+
+    with tempfile.TemporaryDirectory() as directory:
+        pdfs = make_pdfs(args.files, photo_kb=args.photo_kb)
+        for i, pdf in enumerate(pdfs):
+            with open(os.path.join(directory, f"resume_{i:04d}.pdf"), "wb") as fh:
+                fh.write(pdf)
+        print(f"{len(pdfs)} PDFs, {sum(map(len, pdfs)) / 2**20:.0f} MB uploaded")
+        print(f"{'read path':<14} {'uploads (MB)':>12} {'peak RSS (MB)':>14} {'batch (MB)':>11} {'time (s)':>9} {'stored':>7}")
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_upload_memory", "--child", mode, directory],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.split()
+            loaded, peak = int(out[1]) / 1024, int(out[2]) / 1024
+            print(f"{mode:<14} {loaded:>12.0f} {peak:>14.0f} {peak - loaded:>11.0f} {float(out[3]):>9.1f} {out[4]:>7}")
+
+
+if __name__ == "__main__":
+    main()
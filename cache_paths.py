@@ -0,0 +1,42 @@
+import os
+
+CACHE_HOME_ENV = "ATS_CACHE_HOME"
+
+
+def _default_cache_home() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ats-nexus")
+
+
+def private_dir(*parts: str) -> str:
+    """
+    A per-user directory under ATS_CACHE_HOME (default ~/.cache/ats-nexus),
+    created mode 0700. An existing directory must belong to the current user;
+    group/other permissions are stripped. Holds resume text and pickles, so it
+    must never be shared the way a fixed path under /tmp would be.
+    """
+    path = os.path.join(os.environ.get(CACHE_HOME_ENV) or _default_cache_home(), *parts)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid"):
+        st = os.stat(path)
+        if st.st_uid != os.getuid():
+            raise PermissionError(f"{path} is owned by another user; refusing to use it as a cache.")
+        if st.st_mode & 0o077:
+            os.chmod(path, 0o700)
+    return path
+
+
+def private_file(path: str) -> str:
+    """Create `path` mode 0600 if missing (SQLite gives its -wal/-shm files the same mode)."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    os.close(fd)
+    if hasattr(os, "getuid") and os.stat(path).st_mode & 0o077:
+        os.chmod(path, 0o600)
+    return path
+
+
+def owned_privately(st: os.stat_result) -> bool:
+    """True when a stat result belongs to the current user and nobody else can write it."""
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
@@ -0,0 +1,163 @@
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class CandidateIndex:
+    """
+    Inverted index over cleaned resume tokens (output of text_cleaner.clean_text),
+    updated in place as candidates are added or removed.
+
+    Postings keep raw term frequencies in insertion order. BM25 weights are
+    computed at query time, for the query's terms only, over the candidates
+    being ranked (so IDF and average length follow that pool). Each list's
+    maximum weight then drives MaxScore pruning: top_k skips candidates that
+    cannot reach the current K-th best score instead of scoring the pool.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._doc_ids: List[Hashable] = []
+        self._ordinals: Dict[Hashable, int] = {}
+        self._lengths: List[int] = []
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._removed = 0
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._ordinals
+
+    def add(self, doc_id: Hashable, resume_clean: str):
+        """Index a candidate; re-adding a doc id replaces its postings."""
+        if doc_id in self._ordinals:
+            self.remove(doc_id)
+        ordinal = len(self._doc_ids)
+        terms = Counter(resume_clean.split())
+        self._doc_ids.append(doc_id)
+        self._ordinals[doc_id] = ordinal
+        self._lengths.append(sum(terms.values()))
+        for term, tf in terms.items():
+            docs, tfs = self._postings.setdefault(term, ([], []))
+            docs.append(ordinal)
+            tfs.append(tf)
+
+    def add_many(self, items: Iterable[Tuple[Hashable, str]]):
+        for doc_id, resume_clean in items:
+            self.add(doc_id, resume_clean)
+
+    def remove(self, doc_id: Hashable):
+        """Drop a candidate; its postings are skipped until enough removals trigger a compaction."""
+        if self._ordinals.pop(doc_id, None) is None:
+            return
+        self._removed += 1
+        if self._removed > len(self._ordinals):
+            self._compact()
+
+    def _compact(self):
+        live = [(doc_id, ordinal) for doc_id, ordinal in self._ordinals.items()]
+        live.sort(key=lambda item: item[1])
+        remap = {old: new for new, (_, old) in enumerate(live)}
+        self._doc_ids = [doc_id for doc_id, _ in live]
+        self._ordinals = {doc_id: new for new, (doc_id, _) in enumerate(live)}
+        self._lengths = [self._lengths[old] for _, old in live]
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        for term, (docs, tfs) in self._postings.items():
+            kept = [(remap[d], tf) for d, tf in zip(docs, tfs) if d in remap]
+            if kept:
+                postings[term] = ([d for d, _ in kept], [tf for _, tf in kept])
+        self._postings = postings
+        self._removed = 0
+
+    def top_k(
+        self, query_clean: str, k: int = 50, doc_ids: Optional[Iterable[Hashable]] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Best `k` (doc_id, score) pairs for a cleaned JD, highest score first
+        (ties by insertion order), ranking `doc_ids` only when given.
+        Candidates sharing no term with the JD are never returned.
+        """
+        if doc_ids is None:
+            pool = np.array(sorted(self._ordinals.values()), dtype=np.int64)
+        else:
+            pool = np.array(sorted({self._ordinals[d] for d in doc_ids if d in self._ordinals}), dtype=np.int64)
+        query = Counter(t for t in query_clean.split() if t in self._postings)
+        if not len(pool) or not query or k <= 0:
+            return []
+
+        in_pool = np.zeros(len(self._doc_ids), dtype=bool)
+        in_pool[pool] = True
+        lengths = np.asarray(self._lengths, dtype=np.float64)
+        avg_len = lengths[pool].mean()
+        norms = self.k1 * (1 - self.b + self.b * lengths / avg_len) if avg_len else np.full(len(lengths), self.k1)
+
+        # Weighted posting lists for the query terms, restricted to the pool.
+        lists = []
+        for term, qtf in query.items():
+            docs, tfs = self._postings[term]
+            docs = np.asarray(docs, dtype=np.int64)
+            keep = in_pool[docs]
+            if not keep.any():
+                continue
+            docs = docs[keep]
+            tfs = np.asarray(tfs, dtype=np.float64)[keep]
+            idf = np.log(1 + (len(pool) - len(docs) + 0.5) / (len(docs) + 0.5))
+            weights = idf * tfs * (self.k1 + 1) / (tfs + norms[docs]) * qtf
+            lists.append((float(weights.max()), docs.tolist(), weights.tolist()))
+        if not lists:
+            return []
+
+        # Lists sorted by score upper bound; prefix[i] bounds what lists 0..i can still add.
+        lists.sort(key=lambda item: item[0])
+        bounds = [bound for bound, _, _ in lists]
+        lists = [(docs, weights) for _, docs, weights in lists]
+        prefix = list(bounds)
+        for i in range(1, len(prefix)):
+            prefix[i] += prefix[i - 1]
+
+        cursors = [0] * len(lists)
+        heap: List[Tuple[float, int]] = []
+        threshold = 0.0
+        first_essential = 0
+        n_lists = len(lists)
+
+        while first_essential < n_lists:
+            # Only "essential" lists can introduce a document that might enter the top K.
+            doc = min(
+                (lists[i][0][cursors[i]] for i in range(first_essential, n_lists) if cursors[i] < len(lists[i][0])),
+                default=None,
+            )
+            if doc is None:
+                break
+
+            score = 0.0
+            for i in range(first_essential, n_lists):
+                docs, weights = lists[i]
+                if cursors[i] < len(docs) and docs[cursors[i]] == doc:
+                    score += weights[cursors[i]]
+                    cursors[i] += 1
+
+            for i in range(first_essential - 1, -1, -1):
+                if score + prefix[i] <= threshold:
+                    break
+                docs, weights = lists[i]
+                cursors[i] = bisect_left(docs, doc, cursors[i])
+                if cursors[i] < len(docs) and docs[cursors[i]] == doc:
+                    score += weights[cursors[i]]
+
+            if len(heap) < k:
+                heapq.heappush(heap, (score, -doc))
+            elif score > threshold:
+                heapq.heapreplace(heap, (score, -doc))
+            if len(heap) == k:
+                threshold = heap[0][0]
+                while first_essential < n_lists and prefix[first_essential] <= threshold:
+                    first_essential += 1
+
+        ranked = sorted(heap, key=lambda item: (-item[0], -item[1]))
+        return [(self._doc_ids[-neg_doc], score) for score, neg_doc in ranked]
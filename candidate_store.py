@@ -0,0 +1,390 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from candidate_index import CandidateIndex
+from read_resume import extract_cached, extract_many, pool_workers
+from svm_model import ATSMatcher, BatchPrediction, hash_buckets
+from text_cleaner import clean_text, cleaner_fingerprint
+
+STORE_PATH_ENV = "ATS_CANDIDATE_STORE"
+STORE_MAX_ENV = "ATS_CANDIDATE_STORE_MAX"
+DEFAULT_MAX_CANDIDATES = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE,
+    refs INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS candidates (
+    content_hash TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    raw_text TEXT NOT NULL,
+    clean_text TEXT NOT NULL,
+    term_ids BLOB NOT NULL,
+    term_counts BLOB NOT NULL,
+    last_used REAL NOT NULL DEFAULT 0,
+    truncated_by TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS candidates_last_used ON candidates (last_used);
+"""
+# Columns added after the first release; older store files gain them on open.
+_ADDED_COLUMNS = {
+    "last_used": "REAL NOT NULL DEFAULT 0",
+    "truncated_by": "TEXT NOT NULL DEFAULT ''",
+}
+
+
+def content_hash(pdf_bytes: bytes) -> str:
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+@dataclass
+class StoredCandidate:
+    content_hash: str
+    name: str
+    raw_text: str
+    clean_text: str
+    # Extraction budget limit that cut raw_text short ("pages", "chars", "time"), or "".
+    truncated_by: str = ""
+
+
+class CandidateStore:
+    """
+    Pre-vectorized resumes keyed by a SHA-256 of the PDF bytes.
+
+    Each row keeps the extracted text, the cleaned text and a JD-independent
+    n-gram count vector (CSR indices/counts over a store-wide term table), so a
+    new JD only needs IDF re-weighting and a sparse dot product per candidate.
+
+    With `max_candidates`, the least recently added or used rows are evicted
+    to make room for new ones. Rows cleaned by a different text_cleaner
+    (version or stopword list) are dropped when the store is opened.
+
+    A candidate_index.CandidateIndex over the cleaned texts backs shortlist();
+    it is loaded from the rows on first use and kept in step with every add
+    and eviction, so a rerun never re-indexes the pool.
+
+    Each term counts the rows that use it; terms left unused by an eviction
+    or replacement are deleted so the term table tracks the live pool.
+    """
+
+    def __init__(
+        self, path: str = ":memory:", ngram_range: Tuple[int, int] = (1, 2), max_candidates: Optional[int] = None
+    ):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.ngram_range = tuple(ngram_range)
+        self.max_candidates = max_candidates
+        self.evictions = 0
+        self._analyzer = ATSMatcher(ngram_range=ngram_range).term_analyzer()
+        self._lock = threading.Lock()
+        self._index: Optional[CandidateIndex] = None
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(candidates)")}
+        if columns:
+            with self._conn:
+                for column, decl in _ADDED_COLUMNS.items():
+                    if column not in columns:
+                        self._conn.execute(f"ALTER TABLE candidates ADD COLUMN {column} {decl}")
+        term_columns = {row[1] for row in self._conn.execute("PRAGMA table_info(terms)")}
+        if term_columns and "refs" not in term_columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE terms ADD COLUMN refs INTEGER NOT NULL DEFAULT 0")
+                self._recount_terms()
+        self._conn.executescript(_SCHEMA)
+        self._check_meta({"ngram_range": list(ngram_range)})
+        self._check_cleaner(cleaner_fingerprint())
+
+    def _check_meta(self, expected: Dict):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'analyzer'").fetchone()
+        encoded = json.dumps(expected, sort_keys=True)
+        if row is None:
+            with self._conn:
+                self._conn.execute("INSERT INTO meta (key, value) VALUES ('analyzer', ?)", (encoded,))
+        elif row[0] != encoded:
+            raise ValueError(f"Candidate store {self.path!r} was built with analyzer {row[0]}, not {encoded}.")
+
+    def _check_cleaner(self, fingerprint: str):
+        # Stored clean text and counts are derived data: rebuild them rather than refuse the store.
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'cleaner'").fetchone()
+        if row is not None and row[0] == fingerprint:
+            return
+        with self._conn:
+            if row is not None or self._conn.execute("SELECT 1 FROM candidates LIMIT 1").fetchone():
+                self._conn.execute("DELETE FROM candidates")
+                self._conn.execute("DELETE FROM terms")
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('cleaner', ?)", (fingerprint,))
+
+    def _recount_terms(self):
+        # Stores written before terms were reference-counted: count once, drop orphans.
+        refs: Counter = Counter()
+        for (ids_blob,) in self._conn.execute("SELECT term_ids FROM candidates"):
+            refs.update(np.frombuffer(ids_blob, dtype=np.int32).tolist())
+        self._conn.executemany("UPDATE terms SET refs = ? WHERE id = ?", [(n, i) for i, n in refs.items()])
+        self._conn.execute("DELETE FROM terms WHERE refs = 0")
+
+    def _release_terms(self, keys: Sequence[str]):
+        """Drop the term references of rows about to be deleted, and terms nothing uses any more."""
+        refs: Counter = Counter()
+        for start in range(0, len(keys), 500):
+            chunk = list(keys[start:start + 500])
+            marks = ",".join("?" * len(chunk))
+            query = f"SELECT term_ids FROM candidates WHERE content_hash IN ({marks})"
+            for (ids_blob,) in self._conn.execute(query, chunk):
+                refs.update(np.frombuffer(ids_blob, dtype=np.int32).tolist())
+        self._conn.executemany("UPDATE terms SET refs = refs - ? WHERE id = ?", [(n, i) for i, n in refs.items()])
+        self._conn.executemany("DELETE FROM terms WHERE id = ? AND refs <= 0", [(i,) for i in refs])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM candidates WHERE content_hash = ?", (key,)).fetchone() is not None
+
+    def _term_ids(self, terms: Sequence[str]) -> Dict[str, int]:
+        ids: Dict[str, int] = {}
+        for start in range(0, len(terms), 500):
+            chunk = terms[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            ids.update(self._conn.execute(f"SELECT term, id FROM terms WHERE term IN ({marks})", chunk).fetchall())
+        return ids
+
+    def add_text(self, key: str, name: str, raw_text: str, truncated_by: str = "") -> StoredCandidate:
+        """Vectorize and store already-extracted text under `key`."""
+        cleaned = clean_text(raw_text)
+        counts = Counter(self._analyzer(cleaned))
+        terms = sorted(counts)
+        with self._lock, self._conn:
+            self._release_terms([key])
+            self._conn.executemany(
+                "INSERT INTO terms (term, refs) VALUES (?, 1) ON CONFLICT (term) DO UPDATE SET refs = refs + 1",
+                [(t,) for t in terms],
+            )
+            ids = self._term_ids(terms)
+            order = sorted(terms, key=ids.__getitem__)
+            term_ids = np.array([ids[t] for t in order], dtype=np.int32)
+            term_counts = np.array([counts[t] for t in order], dtype=np.int32)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO candidates (content_hash, name, raw_text, clean_text, term_ids, term_counts,"
+                " last_used, truncated_by) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, name, raw_text, cleaned, term_ids.tobytes(), term_counts.tobytes(), time.time(), truncated_by),
+            )
+            if self._index is not None:
+                self._index.add(key, cleaned)
+        return StoredCandidate(key, name, raw_text, cleaned, truncated_by)
+
+    def add_pdf(self, name: str, pdf_bytes: bytes) -> Optional[StoredCandidate]:
+        """Return the stored candidate for these bytes, extracting the PDF only on first sight."""
+        key = content_hash(pdf_bytes)
+        existing = self.get(key)
+        if existing is not None:
+            return existing
+        self._evict(incoming=1)
+        result = extract_cached(key, pdf_bytes)
+        if result.text is None:
+            return None
+        return self.add_text(key, name, result.text, result.truncated_by)
+
+    def add_pdfs(
+        self,
+        items: Sequence[Tuple[str, bytes]],
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Optional[StoredCandidate]]:
+        """
+        Batch add_pdf for (name, pdf_bytes) pairs, results in input order.
+
+        Contents already in the store, or repeated within `items`, are not
+        extracted again; the rest come from the extraction cache or a process
+        pool, which is only started when the batch has enough pages for it
+        (read_resume.pool_workers). `progress(done, total)` is called as files
+        resolve, counting every input item. Eviction under `max_candidates`
+        happens before the batch is added and never removes this batch's rows.
+        """
+        keys = [content_hash(pdf_bytes) for _, pdf_bytes in items]
+        copies = Counter(keys)
+        found: Dict[str, Optional[StoredCandidate]] = {}
+        todo: Dict[str, Tuple[str, bytes]] = {}
+        for (name, pdf_bytes), key in zip(items, keys):
+            if key in found or key in todo:
+                continue
+            existing = self.get(key)
+            if existing is not None:
+                found[key] = existing
+            else:
+                todo[key] = (name, pdf_bytes)
+
+        done = sum(copies[key] for key in found)
+        if progress:
+            progress(done, len(keys))
+        if todo:
+            self._evict(incoming=len(todo), keep=len(found))
+            # Small batches are extracted in-process; a worker pool only pays off past its start-up cost.
+            workers = pool_workers((pdf_bytes for _, pdf_bytes in todo.values()), max_workers)
+            for result in extract_many(((key, todo[key][1]) for key in todo), max_workers=workers):
+                key = result.key
+                if result.text is None:
+                    found[key] = None
+                else:
+                    found[key] = self.add_text(key, todo[key][0], result.text, result.truncated_by)
+                done += copies[key]
+                if progress:
+                    progress(done, len(keys))
+        return [found[key] for key in keys]
+
+    def get(self, key: str) -> Optional[StoredCandidate]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT content_hash, name, raw_text, clean_text, truncated_by FROM candidates WHERE content_hash = ?",
+                (key,),
+            ).fetchone()
+            if row:
+                self._conn.execute("UPDATE candidates SET last_used = ? WHERE content_hash = ?", (time.time(), key))
+        return StoredCandidate(*row) if row else None
+
+    def _evict(self, incoming: int, keep: int = 0):
+        """
+        Drop least recently used rows so `incoming` new ones fit under
+        max_candidates, sparing the `keep` most recently used (rows the caller
+        has just looked up).
+        """
+        if not self.max_candidates:
+            return
+        with self._lock, self._conn:
+            total = self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+            excess = min(total + incoming - self.max_candidates, total - keep)
+            if excess > 0:
+                victims = [
+                    row[0]
+                    for row in self._conn.execute(
+                        "SELECT content_hash FROM candidates ORDER BY last_used LIMIT ?", (excess,)
+                    )
+                ]
+                self._release_terms(victims)
+                self._conn.executemany("DELETE FROM candidates WHERE content_hash = ?", [(key,) for key in victims])
+                self.evictions += len(victims)
+                if self._index is not None:
+                    for key in victims:
+                        self._index.remove(key)
+
+    def counts_matrix(self, keys: Sequence[str]) -> sp.csr_matrix:
+        """CSR count matrix for `keys` (row order preserved) over store term ids."""
+        with self._lock:
+            n_terms = self._conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM terms").fetchone()[0]
+            rows = {}
+            for start in range(0, len(keys), 500):
+                chunk = list(keys[start:start + 500])
+                marks = ",".join("?" * len(chunk))
+                query = f"SELECT content_hash, term_ids, term_counts FROM candidates WHERE content_hash IN ({marks})"
+                for key, ids_blob, counts_blob in self._conn.execute(query, chunk):
+                    rows[key] = (ids_blob, counts_blob)
+
+        indptr = [0]
+        indices: List[np.ndarray] = []
+        data: List[np.ndarray] = []
+        for key in keys:
+            if key not in rows:
+                raise KeyError(f"Candidate {key} is not in the store.")
+            ids_blob, counts_blob = rows[key]
+            indices.append(np.frombuffer(ids_blob, dtype=np.int32))
+            data.append(np.frombuffer(counts_blob, dtype=np.int32))
+            indptr.append(indptr[-1] + len(indices[-1]))
+        return sp.csr_matrix(
+            (
+                np.concatenate(data) if data else np.empty(0, dtype=np.int32),
+                np.concatenate(indices) if indices else np.empty(0, dtype=np.int32),
+                np.array(indptr),
+            ),
+            shape=(len(keys), n_terms),
+        )
+
+    def score(self, keys: Sequence[str], matcher: ATSMatcher, explain: int = 0) -> BatchPrediction:
+        """Score stored candidates against a fitted matcher without touching their PDFs."""
+        if tuple(matcher.ngram_range) != self.ngram_range:
+            raise ValueError("Matcher and candidate store use different n-gram ranges.")
+        params = matcher.linear_params()
+        counts = self.counts_matrix(keys)
+        if params.vocabulary is None:
+            projection, names = self._hash_projection(counts, matcher.n_features)
+            return matcher.predict_counts(counts @ projection, explain=explain, names=names)
+        with self._lock:
+            vocabulary = self._term_ids(sorted(params.vocabulary))
+        return matcher.predict_counts(counts, vocabulary, explain=explain)
+
+    def shortlist(self, keys: Sequence[str], query_clean: str, k: int = 50) -> List[int]:
+        """
+        Positions into `keys` of the `k` best BM25 matches for a cleaned JD,
+        best first, from the store's posting-list index (MaxScore top-K, with
+        IDF over `keys`). Candidates sharing no term with the JD are never
+        returned.
+        """
+        if not keys or k <= 0:
+            return []
+        with self._lock:
+            if self._index is None:
+                self._index = CandidateIndex()
+                self._index.add_many(self._conn.execute("SELECT content_hash, clean_text FROM candidates"))
+            ranked = self._index.top_k(query_clean, k, doc_ids=keys)
+        positions = {}
+        for position, key in enumerate(keys):
+            positions.setdefault(key, position)
+        return [positions[key] for key, _ in ranked]
+
+    def _hash_projection(self, counts: sp.csr_matrix, n_features: int) -> Tuple[sp.csr_matrix, Dict[int, str]]:
+        """
+        Term-id x hash-bucket 0/1 matrix mapping `counts` into a hashed feature
+        space, plus bucket -> term names. Only the terms those rows use are
+        looked up and hashed, not the whole store-wide term table.
+        """
+        ids = np.unique(counts.indices).tolist()
+        terms: Dict[int, str] = {}
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                terms.update(self._conn.execute(f"SELECT id, term FROM terms WHERE id IN ({marks})", chunk).fetchall())
+        ids = sorted(terms)
+        names = [terms[i] for i in ids]
+        buckets = hash_buckets(names, n_features) if names else np.empty(0, dtype=np.int64)
+        projection = sp.csr_matrix((np.ones(len(ids)), (ids, buckets)), shape=(counts.shape[1], n_features))
+        return projection, dict(zip(buckets.tolist(), names))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_store: Optional[CandidateStore] = None
+_default_lock = threading.Lock()
+
+
+def get_default_store() -> CandidateStore:
+    """
+    Process-wide store; set ATS_CANDIDATE_STORE to a file path to persist it.
+    Holds at most ATS_CANDIDATE_STORE_MAX candidates (default 5000, 0 for no
+    cap), evicting the least recently used.
+    """
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            max_candidates = os.environ.get(STORE_MAX_ENV)
+            _default_store = CandidateStore(
+                os.environ.get(STORE_PATH_ENV) or ":memory:",
+                max_candidates=int(max_candidates) if max_candidates else DEFAULT_MAX_CANDIDATES,
+            )
+        return _default_store
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from skill_gap import JobSkillProfile, SkillMatrix
+
+STAGE_TOKEN_OVERLAP = "token_overlap"
+STAGE_SKILL_COVERAGE = "skill_coverage"
+
+
+@dataclass
+class CascadeConfig:
+    """Stage-one thresholds in percent; a threshold of 0 disables that stage."""
+
+    min_token_overlap: float = 0.0
+    min_skill_coverage: float = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.min_token_overlap > 0 or self.min_skill_coverage > 0
+
+
+@dataclass
+class PrefilterResult:
+    """
+    Per-resume stage-one outcome. `eliminated_at` is "" for survivors, otherwise
+    the stage that rejected the resume; `skill_coverage` is NaN for resumes
+    rejected before skills were extracted.
+    """
+
+    token_overlap: np.ndarray
+    skill_coverage: np.ndarray
+    eliminated_at: np.ndarray
+
+    @property
+    def passed(self) -> np.ndarray:
+        return self.eliminated_at == ""
+
+    @property
+    def survivors(self) -> np.ndarray:
+        return np.flatnonzero(self.passed)
+
+
+def token_overlap_percent(job_description_clean: str, resumes_clean: Sequence[str]) -> np.ndarray:
+    """Share of the JD's distinct tokens that appear in each resume, 0-100."""
+    jd_tokens = set(job_description_clean.split())
+    if not jd_tokens:
+        return np.full(len(resumes_clean), 100.0)
+    hits = np.fromiter((len(jd_tokens.intersection(r.split())) for r in resumes_clean), dtype=float, count=len(resumes_clean))
+    return np.round(hits * 100.0 / len(jd_tokens), 2)
+
+
+def prefilter(job_description_clean: str, resumes_clean: Sequence[str], config: CascadeConfig) -> PrefilterResult:
+    """
+    Run the cheap stages in cost order: token overlap on every resume, then
+    taxonomy skill coverage on the resumes that are left.
+    """
+    n = len(resumes_clean)
+    eliminated = np.full(n, "", dtype=object)
+    overlap = token_overlap_percent(job_description_clean, resumes_clean)
+    if config.min_token_overlap > 0:
+        eliminated[overlap < config.min_token_overlap] = STAGE_TOKEN_OVERLAP
+
+    coverage = np.full(n, np.nan)
+    if config.min_skill_coverage > 0:
+        alive = np.flatnonzero(eliminated == "")
+        matrix = SkillMatrix.from_texts([resumes_clean[i] for i in alive])
+        coverage[alive] = matrix.coverage_percent(JobSkillProfile.from_text(job_description_clean))
+        eliminated[alive[coverage[alive] < config.min_skill_coverage]] = STAGE_SKILL_COVERAGE
+
+    return PrefilterResult(token_overlap=overlap, skill_coverage=coverage, eliminated_at=eliminated)
+
+
+def cascade_predict(matcher, job_description_clean: str, resumes_clean: Sequence[str], config: CascadeConfig, explain: int = 0):
+    """
+    Prefilter, then run the full matcher on survivors only.
+
+    Returns (PrefilterResult, BatchPrediction for `result.survivors`, in that order).
+    """
+    result = prefilter(job_description_clean, resumes_clean, config)
+    survivors = result.survivors
+    return result, matcher.predict_many([resumes_clean[i] for i in survivors], explain=explain)
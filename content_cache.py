@@ -0,0 +1,86 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_CHARS = 32_000_000
+
+
+def text_digest(text: str) -> bytes:
+    """128-bit BLAKE2b of the UTF-8 text; the cache key, so raw input is never retained."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ContentCache:
+    """
+    Bounded LRU of derived results keyed by a hash of the input text.
+
+    Eviction is by entry count and by total "size" of the cached values as
+    reported by `weigh` (characters for strings, summed item lengths for skill
+    sets), whichever limit is hit first. Values must be treated as immutable.
+    """
+
+    def __init__(
+        self,
+        weigh: Callable[[Any], int],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_chars: int = DEFAULT_MAX_CHARS,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._weigh = weigh
+        self._entries: "OrderedDict[Tuple[bytes, str], Tuple[Any, int]]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, text: str, namespace: str, compute: Callable[[str], Any]) -> Any:
+        """Cached `compute(text)`; `namespace` separates results that depend on more than the text."""
+        key = (text_digest(text), namespace)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Computed outside the lock; two threads racing on the same text both
+        # compute it and the second store simply overwrites an equal value.
+        value = compute(text)
+        weight = self._weigh(value)
+        if weight > self.max_chars:
+            return value
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._chars -= previous[1]
+            self._entries[key] = (value, weight)
+            self._chars += weight
+            while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+                _, (_, evicted_weight) = self._entries.popitem(last=False)
+                self._chars -= evicted_weight
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "chars": self._chars,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
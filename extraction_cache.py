@@ -0,0 +1,148 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Optional, Tuple
+
+from cache_paths import private_dir, private_file
+
+CACHE_PATH_ENV = "ATS_EXTRACTION_CACHE"
+CACHE_MB_ENV = "ATS_EXTRACTION_CACHE_MB"
+CACHE_FILENAME = "extractions.sqlite3"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    content_hash TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    text BLOB NOT NULL,
+    truncated_by TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (content_hash, extractor)
+);
+CREATE INDEX IF NOT EXISTS extractions_last_used ON extractions (last_used);
+"""
+
+
+def pdf_digest(pdf_bytes: bytes) -> str:
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Extracted PDF text on disk, keyed by SHA-256 of the PDF bytes and an
+    extractor version string, stored zlib-compressed.
+
+    The database runs in WAL mode, so Streamlit sessions, CLI runs and pool
+    workers on one machine can read it while another process writes. Once
+    the compressed size passes `max_bytes`, the least recently used rows are
+    evicted. Resume text is personal data: a new database file is created
+    mode 0600.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True)
+            private_file(path)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+
+    def get(self, digest: str, extractor: str) -> Optional[Tuple[str, str]]:
+        """(text, truncated_by) when cached; the hit refreshes the row's LRU position."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, truncated_by FROM extractions WHERE content_hash = ? AND extractor = ?",
+                (digest, extractor),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE extractions SET last_used = ? WHERE content_hash = ? AND extractor = ?",
+                    (time.time(), digest, extractor),
+                )
+        return zlib.decompress(row[0]).decode("utf-8"), row[1]
+
+    def put(self, digest: str, extractor: str, text: str, truncated_by: str = ""):
+        blob = zlib.compress(text.encode("utf-8", "surrogatepass"), 6)
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?, ?)",
+                (digest, extractor, blob, truncated_by, len(blob), time.time()),
+            )
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0]
+            if total > self.max_bytes:
+                # Keep the most recently used rows that fit under the cap.
+                evicted = self._conn.execute(
+                    """
+                    DELETE FROM extractions WHERE rowid IN (
+                        SELECT rowid FROM (
+                            SELECT rowid, SUM(size) OVER (ORDER BY last_used DESC, rowid DESC) AS kept
+                            FROM extractions
+                        ) WHERE kept > ?
+                    )
+                    """,
+                    (self.max_bytes,),
+                ).rowcount
+                self.evictions += evicted
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM extractions")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions").fetchone()
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[ExtractionCache] = None
+_default_lock = threading.Lock()
+
+
+def get_default_extraction_cache() -> Optional[ExtractionCache]:
+    """
+    Process-wide cache at ATS_EXTRACTION_CACHE (default: extractions.sqlite3
+    in the per-user cache dir, see cache_paths.private_dir), capped at
+    ATS_EXTRACTION_CACHE_MB megabytes. ATS_EXTRACTION_CACHE=off disables it.
+    """
+    global _default_cache
+    path = os.environ.get(CACHE_PATH_ENV)
+    if path and path.lower() == "off":
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            path = path or os.path.join(private_dir(), CACHE_FILENAME)
+            max_mb = os.environ.get(CACHE_MB_ENV)
+            max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+            _default_cache = ExtractionCache(path, max_bytes)
+        return _default_cache
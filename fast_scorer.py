@@ -0,0 +1,84 @@
+"""
+Dependency-light scorer for models exported with ATSMatcher.export.
+
+Only NumPy is imported, so scoring workers start without loading scikit-learn
+or unpickling a Pipeline. Inputs are cleaned resumes, as for ATSMatcher.
+"""
+
+import json
+import re
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from ats_results import BatchPrediction, PredictionResult, batch_from_probs, calibrate
+
+SUPPORTED_FORMAT_VERSION = 1
+
+
+class ExportedScorer:
+    def __init__(self, terms: np.ndarray, idf: np.ndarray, coef: np.ndarray, meta: Dict):
+        if meta.get("format_version") != SUPPORTED_FORMAT_VERSION:
+            raise ValueError(f"Unsupported export format {meta.get('format_version')!r}.")
+        self.vocabulary = {str(term): col for col, term in enumerate(terms)}
+        self.idf = idf
+        self.coef = coef
+        self.intercept = float(meta["intercept"])
+        self.prob_a = float(meta["prob_a"])
+        self.prob_b = float(meta["prob_b"])
+        self.calibration = meta["calibration"]
+        self.min_n, self.max_n = meta["ngram_range"]
+        self.lowercase = bool(meta["lowercase"])
+        self._token_re = re.compile(meta["token_pattern"])
+
+    @classmethod
+    def load(cls, path: str) -> "ExportedScorer":
+        with open(f"{path}.json", encoding="utf-8") as fh:
+            meta = json.load(fh)
+        with np.load(f"{path}.npz", allow_pickle=False) as arrays:
+            return cls(arrays["terms"], arrays["idf"], arrays["coef"], meta)
+
+    def _term_columns(self, text: str) -> List[int]:
+        """Vocabulary columns of every n-gram in `text`, mirroring sklearn's word analyzer."""
+        if self.lowercase:
+            text = text.lower()
+        tokens = self._token_re.findall(text)
+        vocab = self.vocabulary
+        cols = []
+        n_tokens = len(tokens)
+        for n in range(self.min_n, min(self.max_n, n_tokens) + 1):
+            for i in range(n_tokens - n + 1):
+                col = vocab.get(tokens[i] if n == 1 else " ".join(tokens[i:i + n]))
+                if col is not None:
+                    cols.append(col)
+        return cols
+
+    def decision_function(self, resumes_clean: Iterable[str]) -> np.ndarray:
+        rows = []
+        cols = []
+        n_docs = 0
+        for row, text in enumerate(resumes_clean):
+            doc_cols = self._term_columns(text)
+            rows.extend([row] * len(doc_cols))
+            cols.extend(doc_cols)
+            n_docs = row + 1
+        if not n_docs:
+            return np.empty(0)
+
+        n_terms = len(self.idf)
+        keys, tf = np.unique(np.asarray(rows, dtype=np.int64) * n_terms + np.asarray(cols, dtype=np.int64), return_counts=True)
+        doc = keys // n_terms
+        col = keys % n_terms
+        weight = tf * self.idf[col]
+        norms = np.sqrt(np.bincount(doc, weights=weight * weight, minlength=n_docs))
+        dots = np.bincount(doc, weights=weight * self.coef[col], minlength=n_docs)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            decision = np.where(norms > 0, dots / norms, 0.0)
+        return decision + self.intercept
+
+    def predict_many(self, resumes_clean: Iterable[str]) -> BatchPrediction:
+        decision = self.decision_function(resumes_clean)
+        return batch_from_probs(calibrate(decision, self.prob_a, self.prob_b, self.calibration))
+
+    def predict_match(self, resume_clean: str) -> PredictionResult:
+        return self.predict_many([resume_clean]).row(0)
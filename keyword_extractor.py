@@ -0,0 +1,188 @@
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import threading
+import zlib
+from collections import Counter
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+BACKGROUND_IDF_ENV = "ATS_BACKGROUND_IDF"
+DEFAULT_IDF_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "background_idf.npy")
+DEFAULT_BUCKETS = 2**18
+
+_TERM_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9+#.-]+")
+_STOPWORDS = frozenset(
+    {
+        "with",
+        "from",
+        "that",
+        "this",
+        "have",
+        "will",
+        "your",
+        "their",
+        "using",
+        "ability",
+        "strong",
+        "experience",
+        "knowledge",
+        "skills",
+        "skill",
+        "years",
+        "year",
+        "for",
+        "and",
+        "the",
+        "you",
+        "are",
+        "our",
+        "into",
+        "role",
+        "job",
+    }
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TERM_RE.findall(text.lower()) if t not in _STOPWORDS and len(t) > 2]
+
+
+def term_buckets(terms: Iterable[str], n_buckets: int) -> np.ndarray:
+    """Stable (CRC-32) bucket per term, so lookups need no vocabulary in memory."""
+    return np.fromiter((zlib.crc32(t.encode("utf-8")) % n_buckets for t in terms), dtype=np.int64)
+
+
+class BackgroundIDF:
+    """
+    Smoothed IDF, ln((1 + N) / (1 + df)) + 1, over a hashed term space.
+
+    The array is a plain float32 .npy opened with mmap_mode="r", so loading is
+    a file map and a lookup is a CRC-32 plus an index; unseen terms fall in
+    empty buckets and get the maximum IDF. Colliding terms share a bucket.
+    """
+
+    def __init__(self, idf: np.ndarray):
+        self.idf_table = idf
+
+    @property
+    def n_buckets(self) -> int:
+        return len(self.idf_table)
+
+    @classmethod
+    def load(cls, path: str) -> "BackgroundIDF":
+        return cls(np.load(path, mmap_mode="r"))
+
+    @classmethod
+    def build(cls, documents: Iterable[str], n_buckets: int = DEFAULT_BUCKETS) -> "BackgroundIDF":
+        df = np.zeros(n_buckets, dtype=np.int64)
+        n_docs = 0
+        for doc in documents:
+            n_docs += 1
+            df[np.unique(term_buckets(set(tokenize(doc)), n_buckets))] += 1
+        idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+        return cls(idf.astype(np.float32))
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.save(path, np.asarray(self.idf_table, dtype=np.float32))
+
+    def idf(self, terms: List[str]) -> np.ndarray:
+        return np.asarray(self.idf_table[term_buckets(terms, self.n_buckets)], dtype=float)
+
+
+class KeywordExtractor:
+    """Ranks a document's terms by TF x background IDF; plain TF when no background is loaded."""
+
+    def __init__(self, background: Optional[BackgroundIDF] = None):
+        self.background = background
+
+    def scores(self, text: str) -> Counter:
+        counts = Counter(tokenize(text))
+        if self.background is None or not counts:
+            return counts
+        terms = list(counts)
+        weights = np.fromiter(counts.values(), dtype=float, count=len(terms)) * self.background.idf(terms)
+        return Counter(dict(zip(terms, weights.tolist())))
+
+    def top_terms(self, text: str, limit: int = 10) -> List[str]:
+        # most_common keeps first-occurrence order among ties.
+        return [term for term, _ in self.scores(text).most_common(limit)]
+
+
+_default_extractor: Optional[KeywordExtractor] = None
+_default_lock = threading.Lock()
+
+
+def get_default_extractor() -> KeywordExtractor:
+    """ATS_BACKGROUND_IDF or data/background_idf.npy when present, else plain term frequency."""
+    global _default_extractor
+    with _default_lock:
+        if _default_extractor is None:
+            path = os.environ.get(BACKGROUND_IDF_ENV) or DEFAULT_IDF_PATH
+            _default_extractor = KeywordExtractor(BackgroundIDF.load(path) if os.path.exists(path) else None)
+        return _default_extractor
+
+
+def extract_keywords(text: str, limit: int = 10) -> List[str]:
+    return get_default_extractor().top_terms(text, limit)
+
+
+def _iter_corpus(paths: List[str], store: Optional[str]) -> Iterable[str]:
+    for path in paths:
+        files = [path]
+        if os.path.isdir(path):
+            files = [os.path.join(root, name) for root, _, names in os.walk(path) for name in sorted(names)]
+        for file_path in files:
+            ext = os.path.splitext(file_path)[1].lower()
+            if ext == ".pdf":
+                from read_resume import extract_text_from_pdf, mapped_pdf
+
+                try:
+                    with mapped_pdf(file_path) as pdf_data:
+                        text = extract_text_from_pdf(pdf_data)
+                except Exception as exc:
+                    print(f"skipping {file_path}: {exc}", file=sys.stderr)
+                    continue
+                yield text
+            elif ext in (".txt", ".md"):
+                with open(file_path, encoding="utf-8", errors="replace") as fh:
+                    yield fh.read()
+    if store:
+        conn = sqlite3.connect(store)
+        try:
+            for (raw_text,) in conn.execute("SELECT raw_text FROM candidates"):
+                yield raw_text
+        finally:
+            conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build background IDF statistics for keyword extraction.")
+    parser.add_argument("inputs", nargs="*", help="Job description / resume files (.txt, .md, .pdf) or directories.")
+    parser.add_argument("--store", help="Also read every resume in this candidate store (ATS_CANDIDATE_STORE file).")
+    parser.add_argument("--buckets", type=int, default=DEFAULT_BUCKETS)
+    parser.add_argument("--output", default=DEFAULT_IDF_PATH)
+    args = parser.parse_args(argv)
+
+    n_docs = 0
+
+    def counted(docs):
+        nonlocal n_docs
+        for doc in docs:
+            n_docs += 1
+            yield doc
+
+    background = BackgroundIDF.build(counted(_iter_corpus(args.inputs, args.store)), args.buckets)
+    if not n_docs:
+        parser.error("no documents found")
+    background.save(args.output)
+    print(f"wrote {args.output}: {n_docs} documents, {args.buckets} buckets", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+import hashlib
+import io
+import json
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import sklearn
+
+from cache_paths import owned_privately, private_dir, private_file
+from svm_model import ATSMatcher
+
+CACHE_DIR_ENV = "ATS_MATCHER_CACHE_DIR"
+FEEDBACK_DB_ENV = "ATS_FEEDBACK_DB"
+DEFAULT_MAX_ENTRIES = 32
+# A matcher's SGD state is checkpointed once this many feedback batches are
+# logged past its last checkpoint; older batches (and their resume text) are
+# then deleted, so a fresh process replays at most this many.
+CHECKPOINT_EVERY = 10
+# Per-key fit/feedback locks are striped over a fixed set, so a key always maps
+# to the same lock and nothing has to be created or dropped per key.
+_LOCK_STRIPES = 64
+
+_FEEDBACK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    matcher_key TEXT NOT NULL,
+    resumes TEXT NOT NULL,
+    labels TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS feedback_key ON feedback (matcher_key, id);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    matcher_key TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL,
+    state BLOB NOT NULL,
+    created REAL NOT NULL
+);
+"""
+
+
+def matcher_key(job_description_clean: str, config: Optional[Dict] = None) -> str:
+    """Stable key for a fitted matcher: cleaned JD + model config + sklearn version."""
+    payload = json.dumps(
+        {
+            "jd": job_description_clean,
+            "config": ATSMatcher(**(config or {})).config,
+            "sklearn": sklearn.__version__,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FeedbackLog:
+    """
+    Append-only recruiter feedback, one row per record_feedback call, keyed by
+    matcher key. WAL-mode SQLite, so every worker process appends to and
+    replays the same history; row ids give the global order.
+
+    A checkpoint holds a matcher's SGD state (ATSMatcher.feedback_state, as
+    plain .npz arrays) after every batch up to `last_id`; saving one deletes
+    the batches it covers, so stored resume text stays bounded per matcher.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            private_file(path)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_FEEDBACK_SCHEMA)
+
+    def append(self, key: str, resumes_clean: List[str], labels: List[int]) -> int:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO feedback (matcher_key, resumes, labels, created) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(resumes_clean), json.dumps(labels), time.time()),
+            )
+            return cursor.lastrowid
+
+    def pending(self, key: str, after_id: int = 0) -> int:
+        """Number of batches for `key` logged after `after_id`."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM feedback WHERE matcher_key = ? AND id > ?", (key, after_id)
+            ).fetchone()[0]
+
+    def history(
+        self, key: str, after_id: int = 0
+    ) -> Tuple[Optional[Tuple[int, Dict[str, np.ndarray]]], List[Tuple[int, List[str], List[int]]]]:
+        """
+        What a matcher that has absorbed feedback up to `after_id` still needs:
+        the checkpoint (last_id, state) when it is newer than `after_id`, else
+        None, and the batches logged after that point. Both come from one read
+        snapshot, so a checkpoint saved concurrently cannot hide batches.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                checkpoint = self._conn.execute(
+                    "SELECT last_id, state FROM checkpoints WHERE matcher_key = ? AND last_id > ?", (key, after_id)
+                ).fetchone()
+                start = checkpoint[0] if checkpoint else after_id
+                rows = self._conn.execute(
+                    "SELECT id, resumes, labels FROM feedback WHERE matcher_key = ? AND id > ? ORDER BY id",
+                    (key, start),
+                ).fetchall()
+            finally:
+                self._conn.execute("COMMIT")
+        state = None
+        if checkpoint:
+            with np.load(io.BytesIO(checkpoint[1]), allow_pickle=False) as arrays:
+                state = (checkpoint[0], {name: arrays[name] for name in arrays.files})
+        return state, [(row_id, json.loads(resumes), json.loads(labels)) for row_id, resumes, labels in rows]
+
+    def save_checkpoint(self, key: str, last_id: int, state: Dict[str, np.ndarray]):
+        """Store `state` as of `last_id` unless a newer checkpoint exists, and drop the batches it covers."""
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **state)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO checkpoints (matcher_key, last_id, state, created) VALUES (?, ?, ?, ?)
+                ON CONFLICT (matcher_key) DO UPDATE SET
+                    last_id = excluded.last_id, state = excluded.state, created = excluded.created
+                WHERE excluded.last_id > checkpoints.last_id
+                """,
+                (key, last_id, buffer.getvalue(), time.time()),
+            )
+            self._conn.execute("DELETE FROM feedback WHERE matcher_key = ? AND id <= ?", (key, last_id))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class MatcherRegistry:
+    """
+    Fitted ATSMatcher cache keyed by JD hash.
+
+    An in-memory LRU is shared by every caller in the process (all Streamlit
+    sessions); when `cache_dir` is set, JD-only fits are also pickled there so
+    other worker processes can load them instead of refitting. Recruiter
+    feedback lives in `feedback` (a FeedbackLog): every matcher handed out
+    starts from the latest checkpoint and replays the batches logged after it,
+    in log order, so feedback survives eviction, restarts and concurrent
+    workers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Optional[str] = None,
+        feedback: Optional[FeedbackLog] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.feedback = feedback or FeedbackLog()
+        self._entries: "OrderedDict[str, ATSMatcher]" = OrderedDict()
+        # Feedback log id each cached matcher has absorbed up to.
+        self._applied: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: str) -> Optional[ATSMatcher]:
+        with self._lock:
+            model = self._entries.get(key)
+            if model is not None:
+                self._entries.move_to_end(key)
+            return model
+
+    def _store(self, key: str, model: ATSMatcher):
+        with self._lock:
+            self._entries[key] = model
+            # A newly cached matcher has absorbed no feedback yet.
+            self._applied[key] = 0
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._applied.pop(evicted, None)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        return self._key_locks[int(key[:8], 16) % _LOCK_STRIPES]
+
+    def _catch_up(self, key: str, model: ATSMatcher):
+        """
+        Bring the matcher up to date with feedback logged by any process: jump
+        to a newer checkpoint, replay the batches after it, and checkpoint once
+        CHECKPOINT_EVERY batches have piled up. Caller holds the key lock.
+        """
+        if model.engine != "sgd":
+            return
+        applied = self._applied.get(key, 0)
+        checkpoint, batches = self.feedback.history(key, applied)
+        if checkpoint is not None:
+            applied, state = checkpoint
+            model.load_feedback_state(state)
+        for row_id, resumes, labels in batches:
+            model.partial_fit(resumes, labels)
+            applied = row_id
+        self._applied[key] = applied
+        # Every batch still in the log is past the last checkpoint.
+        if self.feedback.pending(key) >= CHECKPOINT_EVERY:
+            self.feedback.save_checkpoint(key, applied, model.feedback_state())
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _load_from_disk(self, key: str) -> Optional[ATSMatcher]:
+        if not self.cache_dir:
+            return None
+        try:
+            # Unpickling runs code, so only read files nobody else could have written.
+            if not owned_privately(os.stat(self.cache_dir)):
+                return None
+            with open(self._disk_path(key), "rb") as fh:
+                if not owned_privately(os.fstat(fh.fileno())):
+                    return None
+                model = pickle.load(fh)
+            # Only JD-only fits are cached; feedback comes from the log, so a
+            # pickle that already absorbed some would apply it twice.
+            return model if not getattr(model, "feedback_count", 0) else None
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # A truncated or incompatible pickle is treated as a miss and refitted.
+            return None
+
+    def _save_to_disk(self, key: str, model: ATSMatcher):
+        if not self.cache_dir:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(model, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._disk_path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, job_description_clean: str, config: Optional[Dict] = None) -> ATSMatcher:
+        """Return a fitted matcher for the cleaned JD (fitting it at most once), with all logged feedback applied."""
+        key = matcher_key(job_description_clean, config)
+        # Concurrent reruns for the same JD wait here instead of fitting in parallel.
+        with self._key_lock(key):
+            return self._get_locked(key, job_description_clean, config)
+
+    def _get_locked(self, key: str, job_description_clean: str, config: Optional[Dict]) -> ATSMatcher:
+        model = self._lookup(key)
+        if model is not None:
+            self.hits += 1
+        else:
+            model = self._load_from_disk(key)
+            if model is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                model = ATSMatcher(**(config or {}))
+                model.fit(job_description_clean)
+                self._save_to_disk(key, model)
+            self._store(key, model)
+        self._catch_up(key, model)
+        return model
+
+    def record_feedback(
+        self,
+        job_description_clean: str,
+        resumes_clean: Iterable[str],
+        labels: Iterable[int],
+        config: Optional[Dict] = None,
+    ) -> ATSMatcher:
+        """
+        Log recruiter feedback for this JD's `engine="sgd"` matcher and apply it
+        to the shared in-process model. Other processes pick it up from the log
+        the next time they hand that matcher out.
+        """
+        resumes_clean = list(resumes_clean)
+        labels = [int(label) for label in labels]
+        if len(resumes_clean) != len(labels):
+            raise ValueError("Each feedback resume needs exactly one label.")
+        key = matcher_key(job_description_clean, config)
+        # One lock hold: an eviction in between could otherwise make this
+        # replay feedback the model already absorbed.
+        with self._key_lock(key):
+            model = self._get_locked(key, job_description_clean, config)
+            if model.engine != "sgd":
+                raise ValueError("Feedback is only absorbed by engine='sgd' matchers.")
+            if resumes_clean:
+                self.feedback.append(key, resumes_clean, labels)
+            self._catch_up(key, model)
+        return model
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._applied.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+
+_default_registry: Optional[MatcherRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_default_registry() -> MatcherRegistry:
+    """
+    Process-wide registry; set ATS_MATCHER_CACHE_DIR to share fits across
+    workers. Feedback is logged to ATS_FEEDBACK_DB, by default a private
+    per-user file (see cache_paths.private_dir).
+    """
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            feedback_path = os.environ.get(FEEDBACK_DB_ENV) or os.path.join(private_dir(), "feedback.sqlite3")
+            _default_registry = MatcherRegistry(
+                cache_dir=os.environ.get(CACHE_DIR_ENV) or None,
+                feedback=FeedbackLog(feedback_path),
+            )
+        return _default_registry
+
+
+def get_fitted_matcher(job_description_clean: str, config: Optional[Dict] = None) -> ATSMatcher:
+    return get_default_registry().get(job_description_clean, config)
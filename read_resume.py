@@ -1,39 +1,492 @@
 import io
-from typing import Optional
+import itertools
+import mmap
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO, Callable, Dict, Hashable, Iterable, Iterator, Optional, Sequence, Tuple, Union
 
 import pdfplumber
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdffont import PDFUnicodeNotDefined
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 
+from extraction_cache import ExtractionCache, get_default_extraction_cache, pdf_digest
 
-def extract_text_from_pdf(pdf_bytes: bytes) -> str:
-    """Extract raw text from PDF bytes using pdfplumber."""
-    text_chunks = []
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text() or ""
+BACKENDS_ENV = "ATS_PDF_BACKENDS"
+# Part of the extraction cache key; bump when the text extracted from a given PDF changes.
+EXTRACTOR_VERSION = 1
+# Each worker is replaced after this many files so pdfplumber's per-process
+# memory growth on large or odd PDFs cannot accumulate over a long batch.
+DEFAULT_TASKS_PER_WORKER = 50
+# Starting a spawned worker (interpreter plus pdfminer import) takes about a
+# second, roughly 25 pages of serial extraction; smaller batches stay in-process.
+MIN_PAGES_PER_WORKER = 25
+MAX_UPLOAD_MB_ENV = "ATS_MAX_UPLOAD_MB"
+MAX_UPLOAD_BYTES = int(float(os.environ.get(MAX_UPLOAD_MB_ENV) or 20) * 1024 * 1024)
+
+# Extractors take the PDF as bytes or any buffer over them (memoryview, mmap).
+PdfData = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class ExtractionQualityError(ValueError):
+    """A backend produced text that fails the quality checks; the next backend is tried."""
+
+
+class _TextStreamDevice(PDFTextDevice):
+    """
+    Collects decoded characters in content-stream order, inserting a newline
+    when the baseline moves and a space when the gap to the previous glyph is
+    wider than 0.15 em. No layout objects are built.
+    """
+
+    def __init__(self, rsrcmgr):
+        super().__init__(rsrcmgr)
+        self.reset()
+
+    def reset(self):
+        """Start a new page; the quality counters are per page."""
+        self.parts = []
+        self._x = None
+        self._y = None
+        self.chars = 0
+        self.unmapped = 0
+        self.line_breaks = 0
+        self.upward_breaks = 0
+
+    def render_char(self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate):
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = ""
+            self.unmapped += 1
+        self.chars += 1
+        adv = font.char_width(cid) * fontsize * scaling
+        a, _, c, d, e, f = matrix
+        size = fontsize * (c * c + d * d) ** 0.5 or 1.0
+        if self._y is not None:
+            if abs(f - self._y) > size * 0.5:
+                self.parts.append("\n")
+                self.line_breaks += 1
+                if f > self._y:
+                    self.upward_breaks += 1
+            elif e - self._x > size * 0.15 and text != " ":
+                self.parts.append(" ")
+        self._x = e + adv * a
+        self._y = f
+        self.parts.append(text)
+        return adv
+
+
+def _quality_problem(text: str, device: _TextStreamDevice) -> Optional[str]:
+    if device.unmapped > 0.05 * device.chars:
+        return "glyphs without a unicode mapping"
+    tokens = text.split()
+    if len(tokens) >= 20 and sum(len(t) == 1 for t in tokens) > 0.4 * len(tokens):
+        return "fragmented words"
+    # Single-column text only moves down the page; many upward jumps mean the
+    # stream order is not reading order (multi-column or shuffled layout).
+    if device.line_breaks >= 10 and device.upward_breaks > 0.1 * device.line_breaks:
+        return "content stream out of reading order"
+    return None
+
+
+class _BufferReader(io.RawIOBase):
+    """
+    Read-only, seekable file over any bytes-like object (a memoryview, or an
+    mmap from mapped_pdf). Unlike io.BytesIO it never copies the whole
+    buffer; each read copies only the span requested.
+    """
+
+    def __init__(self, data: PdfData):
+        super().__init__()
+        self._view = memoryview(data).cast("B")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = max(0, min(len(buffer), len(self._view) - self._pos))
+        buffer[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self):
+        # Release the view so an mmap behind it can be closed.
+        self._view.release()
+        super().close()
+
+
+def _open_pdf(data: PdfData) -> IO[bytes]:
+    # BytesIO shares a bytes object's memory until written to, but copies any other buffer.
+    if isinstance(data, bytes):
+        return io.BytesIO(data)
+    return io.BufferedReader(_BufferReader(data))
+
+
+def _stream_pages(pdf_bytes: PdfData, start: int = 0) -> Iterator[str]:
+    """Fast path: walk each page's content stream with pdfminer, no layout analysis."""
+    rsrcmgr = PDFResourceManager(caching=True)
+    device = _TextStreamDevice(rsrcmgr)
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    seen_text = False
+    with _open_pdf(pdf_bytes) as fp:
+        for page in itertools.islice(PDFPage.get_pages(fp), start, None):
+            device.reset()
+            interpreter.process_page(page)
+            if not seen_text and device.chars == 0:
+                # No text on any page so far (e.g. a scan, or text drawn as
+                # paths): the next backend reads the document from here.
+                raise ExtractionQualityError("no text")
+            seen_text = True
+            page_text = "".join(device.parts)
+            problem = _quality_problem(page_text, device)
+            if problem:
+                raise ExtractionQualityError(problem)
+            yield page_text
+
+
+def _pdfplumber_pages(pdf_bytes: PdfData, start: int = 0) -> Iterator[str]:
+    with _open_pdf(pdf_bytes) as fp, pdfplumber.open(fp) as pdf:
+        for page in pdf.pages[start:]:
+            yield page.extract_text() or ""
+            # Drop the page's parsed layout objects before moving on.
+            page.close()
+
+
+def _count_pages(pdf_bytes: PdfData) -> int:
+    """Walks the page tree only; no content stream is interpreted."""
+    with _open_pdf(pdf_bytes) as fp:
+        return sum(1 for _ in PDFPage.get_pages(fp))
+
+
+# name -> callable(pdf_bytes, start_page) yielding one text per page, lazily.
+# Raise ExtractionQualityError (or any error) to hand the remaining pages to the next backend.
+EXTRACTION_BACKENDS: Dict[str, Callable[[PdfData, int], Iterator[str]]] = {
+    "stream": _stream_pages,
+    "pdfplumber": _pdfplumber_pages,
+}
+DEFAULT_BACKENDS: Tuple[str, ...] = tuple(
+    name.strip() for name in (os.environ.get(BACKENDS_ENV) or "stream,pdfplumber").split(",") if name.strip()
+)
+
+TRUNCATED_PAGES = "pages"
+TRUNCATED_CHARS = "chars"
+TRUNCATED_TIME = "time"
+
+
+@dataclass
+class ExtractionBudget:
+    """Per-document limits; None disables a limit. The time budget is checked between pages."""
+
+    max_pages: Optional[int] = None
+    max_chars: Optional[int] = None
+    max_seconds: Optional[float] = None
+
+
+# Applied to uploads and bulk batches: generous for a resume, but an attached
+# portfolio or thesis stops after a few pages' worth of work.
+DEFAULT_BUDGET = ExtractionBudget(max_pages=20, max_chars=200_000, max_seconds=30.0)
+
+
+class PageStream:
+    """
+    Page texts of one PDF, extracted lazily as the stream is iterated.
+
+    Pages come from `backends` in order; when one fails part-way, the next
+    continues from the failed page. Iteration stops when `budget` runs out,
+    and `truncated_by` then names the limit that was hit ("" when the whole
+    document was read). A stream can be iterated once.
+    """
+
+    def __init__(
+        self,
+        pdf_bytes: PdfData,
+        budget: Optional[ExtractionBudget] = None,
+        backends: Sequence[str] = DEFAULT_BACKENDS,
+    ):
+        self.pdf_bytes = pdf_bytes
+        self.budget = budget or ExtractionBudget()
+        self.backends = tuple(backends)
+        self.pages_read = 0
+        self.chars_read = 0
+        self.truncated_by = ""
+
+    @property
+    def truncated(self) -> bool:
+        return bool(self.truncated_by)
+
+    def _pages(self) -> Iterator[str]:
+        for position, name in enumerate(self.backends):
+            try:
+                for page_text in EXTRACTION_BACKENDS[name](self.pdf_bytes, self.pages_read):
+                    yield page_text
+                return
+            except Exception:
+                if position == len(self.backends) - 1:
+                    raise
+
+    def _has_more_pages(self) -> bool:
+        return _count_pages(self.pdf_bytes) > self.pages_read
+
+    def __iter__(self) -> Iterator[str]:
+        budget = self.budget
+        started = time.perf_counter()
+        for page_text in self._pages():
+            self.pages_read += 1
+            if budget.max_chars is not None and self.chars_read + len(page_text) > budget.max_chars:
+                page_text = page_text[: budget.max_chars - self.chars_read]
+                self.truncated_by = TRUNCATED_CHARS
+            self.chars_read += len(page_text)
             if page_text.strip():
-                text_chunks.append(page_text)
-    return "\n".join(text_chunks).strip()
+                yield page_text
+            if self.truncated_by:
+                return
+            limit = ""
+            if budget.max_pages is not None and self.pages_read >= budget.max_pages:
+                limit = TRUNCATED_PAGES
+            elif budget.max_chars is not None and self.chars_read >= budget.max_chars:
+                limit = TRUNCATED_CHARS
+            elif budget.max_seconds is not None and time.perf_counter() - started >= budget.max_seconds:
+                limit = TRUNCATED_TIME
+            if limit:
+                if self._has_more_pages():
+                    self.truncated_by = limit
+                return
 
+    def text(self) -> str:
+        return "\n".join(self).strip()
+
+
+def extract_text_from_pdf(
+    pdf_bytes: PdfData,
+    backends: Sequence[str] = DEFAULT_BACKENDS,
+    budget: Optional[ExtractionBudget] = None,
+) -> str:
+    """
+    Extract raw text from PDF bytes, trying `backends` in order: the content
+    stream walker first, pdfplumber's layout extraction for the pages where its
+    output looks wrong. Errors from the last backend propagate. Use PageStream
+    directly to consume pages lazily or to see whether `budget` cut the text.
+    """
+    return PageStream(pdf_bytes, budget, backends).text()
+
+
+class UploadTooLargeError(ValueError):
+    """The upload is bigger than the per-file limit (MAX_UPLOAD_BYTES, ATS_MAX_UPLOAD_MB)."""
+
+
+def upload_buffer(uploaded_file, max_bytes: int = MAX_UPLOAD_BYTES) -> bytes:
+    """
+    The upload's bytes, without copying them. A Streamlit upload is a BytesIO
+    built from the received bytes, and getvalue() hands back that same object
+    (getbuffer() would force a private copy). Any other file object is read,
+    but never more than `max_bytes` + 1 bytes of it.
+    """
+    name = getattr(uploaded_file, "name", "upload")
+    size = getattr(uploaded_file, "size", None)
+    if size is not None and size > max_bytes:
+        raise UploadTooLargeError(f"{name} is over the {max_bytes / (1024 * 1024):g} MB upload limit.")
+    if hasattr(uploaded_file, "getvalue"):
+        data = uploaded_file.getvalue()
+    else:
+        data = uploaded_file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise UploadTooLargeError(f"{name} is over the {max_bytes / (1024 * 1024):g} MB upload limit.")
+    return data
 
-def extract_text_from_uploaded_file(uploaded_file) -> str:
-    """Extract text from a Streamlit uploaded file (PDF only)."""
-    if uploaded_file is None:
-        return ""
 
+@contextmanager
+def mapped_pdf(path: str, max_bytes: int = MAX_UPLOAD_BYTES) -> Iterator[PdfData]:
+    """
+    A PDF on disk as a read-only mmap, for CLI batches: the extractors read it
+    through _BufferReader, so its pages come from the OS page cache on demand
+    instead of a heap copy of the file.
+    """
+    size = os.path.getsize(path)
+    if size > max_bytes:
+        raise UploadTooLargeError(f"{path} is over the {max_bytes / (1024 * 1024):g} MB upload limit.")
+    if size == 0:
+        yield b""
+        return
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped
+
+
+@dataclass
+class ExtractionResult:
+    key: Hashable
+    text: Optional[str]
+    error: Optional[str] = None
+    # Budget limit that cut the text short ("pages", "chars", "time"), or "".
+    truncated_by: str = ""
+
+
+def extract_uploaded_file(uploaded_file) -> ExtractionResult:
+    """
+    Extract a Streamlit uploaded file (PDF only) under DEFAULT_BUDGET; the
+    result's truncated_by tells whether the whole document was read.
+    """
     filename = getattr(uploaded_file, "name", "")
+    if uploaded_file is None:
+        return ExtractionResult(filename, "")
     if not filename.lower().endswith(".pdf"):
         raise ValueError("Only PDF resumes are supported.")
 
-    pdf_bytes = uploaded_file.read()
+    pdf_bytes = upload_buffer(uploaded_file)
     if not pdf_bytes:
-        return ""
+        return ExtractionResult(filename, "")
 
-    return extract_text_from_pdf(pdf_bytes)
+    result = extract_cached(filename, pdf_bytes, DEFAULT_BUDGET)
+    if result.text is None:
+        raise ValueError(f"Could not extract {filename}: {result.error}")
+    return result
 
 
-def safe_extract_text(uploaded_file) -> Optional[str]:
-    """Safe wrapper that returns None when extraction fails."""
+def extract_text_from_uploaded_file(uploaded_file) -> str:
+    """Extract text from a Streamlit uploaded file (PDF only)."""
+    return extract_uploaded_file(uploaded_file).text
+
+
+def safe_extract(uploaded_file) -> Optional[ExtractionResult]:
+    """extract_uploaded_file that returns None when extraction fails."""
     try:
-        return extract_text_from_uploaded_file(uploaded_file)
+        return extract_uploaded_file(uploaded_file)
     except Exception:
         return None
+
+
+def safe_extract_text(uploaded_file) -> Optional[str]:
+    """Safe wrapper that returns None when extraction fails."""
+    result = safe_extract(uploaded_file)
+    return None if result is None else result.text
+
+
+def _extract_one(key: Hashable, pdf_bytes: PdfData, budget: Optional[ExtractionBudget] = None) -> ExtractionResult:
+    try:
+        stream = PageStream(pdf_bytes, budget)
+        text = stream.text()
+        return ExtractionResult(key, text, truncated_by=stream.truncated_by)
+    except Exception as exc:
+        return ExtractionResult(key, None, f"{type(exc).__name__}: {exc}")
+
+
+def _extractor_id(budget: Optional[ExtractionBudget], backends: Sequence[str] = DEFAULT_BACKENDS) -> str:
+    """Extraction cache key part: everything besides the PDF bytes that decides the text."""
+    budget = budget or ExtractionBudget()
+    return f"v{EXTRACTOR_VERSION}/{'+'.join(backends)}/pages={budget.max_pages}/chars={budget.max_chars}"
+
+
+def _cache_result(cache: Optional[ExtractionCache], digest: str, extractor: str, result: ExtractionResult):
+    # Failures are retried next time; a time-budget cut depends on machine load, so it is not kept either.
+    if cache is not None and result.text is not None and result.truncated_by != TRUNCATED_TIME:
+        cache.put(digest, extractor, result.text, result.truncated_by)
+
+
+def extract_cached(
+    key: Hashable, pdf_bytes: PdfData, budget: Optional[ExtractionBudget] = DEFAULT_BUDGET
+) -> ExtractionResult:
+    """_extract_one through the default extraction cache, so a PDF seen in any earlier session is not parsed again."""
+    cache = get_default_extraction_cache()
+    digest = pdf_digest(pdf_bytes)
+    extractor = _extractor_id(budget)
+    hit = cache.get(digest, extractor) if cache is not None else None
+    if hit is not None:
+        return ExtractionResult(key, hit[0], truncated_by=hit[1])
+    result = _extract_one(key, pdf_bytes, budget)
+    _cache_result(cache, digest, extractor, result)
+    return result
+
+
+def pool_workers(
+    pdfs: Iterable[PdfData],
+    max_workers: Optional[int] = None,
+    budget: Optional[ExtractionBudget] = DEFAULT_BUDGET,
+) -> int:
+    """
+    Workers worth starting for extract_many over `pdfs`: one per
+    MIN_PAGES_PER_WORKER pages (counted from each page tree, capped by the
+    budget), at most `max_workers`. 1 means extract serially. Counting stops
+    once there are pages enough for every worker.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    needed = max_workers * MIN_PAGES_PER_WORKER
+    pages = 0
+    for pdf_bytes in pdfs:
+        try:
+            n_pages = _count_pages(pdf_bytes)
+        except Exception:
+            n_pages = 1
+        if budget is not None and budget.max_pages is not None:
+            n_pages = min(n_pages, budget.max_pages)
+        pages += n_pages
+        if pages >= needed:
+            break
+    return max(1, min(max_workers, pages // MIN_PAGES_PER_WORKER))
+
+
+def extract_many(
+    items: Iterable[Tuple[Hashable, PdfData]],
+    max_workers: Optional[int] = None,
+    max_tasks_per_child: int = DEFAULT_TASKS_PER_WORKER,
+    budget: Optional[ExtractionBudget] = DEFAULT_BUDGET,
+) -> Iterator[ExtractionResult]:
+    """
+    Extract many PDFs in a process pool, yielding results in completion order.
+
+    Files already in the extraction cache are yielded straight away; only the
+    rest are sent to workers, and their text is cached as it comes back. At
+    most 2 x `max_workers` files are in flight, so the input iterable can be
+    lazy and only that many PDF buffers are queued for workers at once; a
+    memoryview input is copied to bytes only when it is handed to a worker.
+    Failures are yielded with `text=None` and an `error` message instead of
+    raising. Each file is cut off by `budget` (see PageStream). `max_workers=1`
+    extracts serially in this process.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        for key, pdf_bytes in items:
+            yield extract_cached(key, pdf_bytes, budget)
+        return
+
+    cache = get_default_extraction_cache()
+    extractor = _extractor_id(budget)
+    items = iter(items)
+    with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=max_tasks_per_child) as pool:
+        pending: Dict[Future, str] = {}
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < 2 * max_workers:
+                item = next(items, None)
+                if item is None:
+                    exhausted = True
+                    continue
+                key, pdf_bytes = item
+                digest = pdf_digest(pdf_bytes)
+                hit = cache.get(digest, extractor) if cache is not None else None
+                if hit is not None:
+                    yield ExtractionResult(key, hit[0], truncated_by=hit[1])
+                else:
+                    pending[pool.submit(_extract_one, key, bytes(pdf_bytes), budget)] = digest
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                _cache_result(cache, pending.pop(future), extractor, result)
+                yield result
@@ -0,0 +1,165 @@
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+
+from matcher_registry import get_fitted_matcher
+from skill_gap import JobSkillProfile, SkillMatrix
+from svm_model import ENGINES, FEATURES, ATSMatcher, hash_term_counts, score_term_counts
+from text_cleaner import clean_pages, clean_text
+
+
+@dataclass
+class RequisitionMatrix:
+    """
+    N resumes x M job descriptions.
+
+    `skills` is the pool's skill_gap.SkillMatrix over the union of the JD
+    skills and `profiles` holds one JobSkillProfile per requisition, so
+    per-pair matched/missing skills are packed-bit AND / AND-NOT and no pair is
+    ever re-tokenized.
+    """
+
+    resume_names: List[str]
+    requisition_names: List[str]
+    scores: np.ndarray
+    skills: SkillMatrix
+    profiles: List[JobSkillProfile]
+
+    @property
+    def best_fit(self) -> np.ndarray:
+        """Column index of the highest-scoring requisition per resume."""
+        return self.scores.argmax(axis=1)
+
+    def skill_gap(self, resume_index: int, requisition_index: int) -> Dict[str, List[str]]:
+        row = SkillMatrix(self.skills.skill_names, self.skills.bits[resume_index:resume_index + 1])
+        return row.gap_lists(self.profiles[requisition_index])[0]
+
+    def best_fit_rows(self) -> List[Dict]:
+        best_fit = self.best_fit
+        # One vectorized gap pass per requisition that is somebody's best fit.
+        gaps = {j: self.skills.gap_lists(self.profiles[j]) for j in set(best_fit.tolist())}
+        rows = []
+        for i, j in enumerate(best_fit):
+            gap = gaps[j][i]
+            row = {"Resume": self.resume_names[i], "Best Fit Requisition": self.requisition_names[j]}
+            row["Best Fit Score (%)"] = float(self.scores[i, j])
+            for k, req in enumerate(self.requisition_names):
+                row[f"{req} (%)"] = float(self.scores[i, k])
+            row["Matched Skills"] = ", ".join(gap["matched_skills"])
+            row["Missing Skills"] = ", ".join(gap["missing_skills"])
+            rows.append(row)
+        return rows
+
+
+def unique_names(names: Sequence[str]) -> List[str]:
+    """Names with repeats suffixed " (2)", " (3)", ... so each one can key a column."""
+    seen = set(names)
+    counts: Dict[str, int] = {}
+    unique = []
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+        if counts[name] > 1:
+            n = counts[name]
+            while f"{name} ({n})" in seen:
+                n += 1
+            counts[name] = n
+            name = f"{name} ({n})"
+            seen.add(name)
+        unique.append(name)
+    return unique
+
+
+def score_requisitions(
+    job_descriptions_clean: Sequence[str],
+    resumes_clean: Sequence[str],
+    requisition_names: Optional[Sequence[str]] = None,
+    resume_names: Optional[Sequence[str]] = None,
+    config: Optional[Dict] = None,
+) -> RequisitionMatrix:
+    """
+    Score every cleaned resume against every cleaned JD in one matrix pass.
+    Repeated requisition names are made unique (see unique_names).
+    """
+    if not job_descriptions_clean:
+        raise ValueError("At least one job description is required.")
+
+    requisition_names = unique_names(requisition_names or [f"JD {j + 1}" for j in range(len(job_descriptions_clean))])
+    resume_names = list(resume_names or [f"Resume {i + 1}" for i in range(len(resumes_clean))])
+
+    template = ATSMatcher(**(config or {}))
+    params = [get_fitted_matcher(jd, config).linear_params() for jd in job_descriptions_clean]
+    if template.features == "hashing":
+        vocabulary = None
+        counts = hash_term_counts(resumes_clean, template.ngram_range, template.n_features)
+    else:
+        vocabulary = {}
+        for p in params:
+            for term in p.vocabulary:
+                vocabulary.setdefault(term, len(vocabulary))
+        # Resumes are tokenized once against the union of all JD vocabularies.
+        vectorizer = CountVectorizer(vocabulary=vocabulary, analyzer=template.term_analyzer())
+        counts = vectorizer.transform(resumes_clean)
+    scores = np.round(score_term_counts(counts, vocabulary, params) * 100, 2)
+
+    profiles = [JobSkillProfile.from_text(jd) for jd in job_descriptions_clean]
+    skill_names = sorted(set().union(*(profile.skills for profile in profiles)))
+
+    return RequisitionMatrix(
+        resume_names=resume_names,
+        requisition_names=requisition_names,
+        scores=scores,
+        skills=SkillMatrix.from_texts(resumes_clean, skill_names),
+        profiles=profiles,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Rank PDF resumes against several job descriptions.")
+    parser.add_argument("--jd", action="append", required=True, help="Job description text file (repeatable).")
+    parser.add_argument("--engine", default="svm", choices=list(ENGINES))
+    parser.add_argument("--features", default="tfidf", choices=list(FEATURES))
+    parser.add_argument("resumes", nargs="+", help="PDF resumes to screen.")
+    args = parser.parse_args(argv)
+
+    import pandas as pd
+
+    from read_resume import DEFAULT_BUDGET, PageStream, mapped_pdf
+
+    jd_names = [os.path.splitext(os.path.basename(path))[0] for path in args.jd]
+    jds = []
+    for path in args.jd:
+        with open(path, encoding="utf-8") as fh:
+            jds.append(clean_text(fh.read()))
+
+    names = []
+    resumes = []
+    for path in args.resumes:
+        try:
+            with mapped_pdf(path) as pdf_data:
+                pages = PageStream(pdf_data, DEFAULT_BUDGET)
+                resume_clean = clean_pages(pages)
+        except Exception as exc:
+            print(f"skipping {path}: {exc}", file=sys.stderr)
+            continue
+        if pages.truncated:
+            print(f"{path}: read the first {pages.pages_read} pages ({pages.truncated_by} budget)", file=sys.stderr)
+        names.append(os.path.basename(path))
+        resumes.append(resume_clean)
+
+    if not resumes:
+        print("No resumes could be read; nothing to rank.", file=sys.stderr)
+        return 1
+
+    matrix = score_requisitions(jds, resumes, jd_names, names, config={"engine": args.engine, "features": args.features})
+    df = pd.DataFrame(matrix.best_fit_rows()).sort_values(by="Best Fit Score (%)", ascending=False)
+    df.to_csv(sys.stdout, index=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,109 +1,135 @@
-import re
-from typing import Dict, List, Set
-
-
-COMMON_SKILL_SET = {
-    "python",
-    "java",
-    "c++",
-    "sql",
-    "mysql",
-    "postgresql",
-    "mongodb",
-    "aws",
-    "azure",
-    "gcp",
-    "docker",
-    "kubernetes",
-    "git",
-    "linux",
-    "tensorflow",
-    "pytorch",
-    "scikit-learn",
-    "machine",
-    "learning",
-    "artificial",
-    "intelligence",
-    "software",
-    "development",
-    "data",
-    "analysis",
-    "nlp",
-    "streamlit",
-    "flask",
-    "django",
-    "react",
-    "node",
-    "javascript",
-    "html",
-    "css",
-    "excel",
-    "tableau",
-    "powerbi",
-    "communication",
-    "leadership",
-    "problem",
-    "solving",
-    "statistics",
-}
-
-COMMON_SKILL_PHRASES = {
-    "machine learning",
-    "artificial intelligence",
-    "software development",
-    "data analysis",
-    "problem solving",
-}
-
-SKILL_ALIASES = {
-    "ai": "artificial intelligence",
-    "ml": "machine learning",
-    "machinelearning": "machine learning",
-    "artificialintelligence": "artificial intelligence",
-    "softwaredevelopment": "software development",
-}
-
-
-def _tokenize_skills(text: str) -> Set[str]:
-    text_l = text.lower()
-    matched: Set[str] = set()
-    tokens = re.findall(r"[a-zA-Z0-9+#.-]+", text_l)
-    token_set = set(tokens)
-    joined = "".join(tokens)
-
-    # Match multi-word skills first so they appear as meaningful phrases.
-    for phrase in COMMON_SKILL_PHRASES:
-        words = phrase.split()
-        exact_phrase = bool(re.search(rf"\b{re.escape(phrase)}\b", text_l))
-        all_words_present = all(w in token_set for w in words)
-        merged_present = "".join(words) in joined
-        if exact_phrase or all_words_present or merged_present:
-            matched.add(phrase)
-
-    token_matches = {t for t in tokens if t in COMMON_SKILL_SET}
-
-    # Map shorthand/merged variants to canonical phrase skills.
-    for token in token_set:
-        if token in SKILL_ALIASES:
-            matched.add(SKILL_ALIASES[token])
-
-    # If a phrase is present, suppress its component single-word tokens.
-    phrase_parts = set()
-    for phrase in matched:
-        phrase_parts.update(phrase.split())
-    token_matches -= phrase_parts
-
-    return matched | token_matches
+from dataclasses import dataclass
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from content_cache import ContentCache
+from keyword_extractor import extract_keywords, tokenize
+from skill_taxonomy import get_default_taxonomy
+
+
+# Skill sets keyed by a hash of the input text; a repeated JD or resume costs one lookup.
+skill_cache = ContentCache(weigh=lambda skills: sum(len(s) for s in skills))
+
+
+def _tokenize_skills(text: str) -> FrozenSet[str]:
+    taxonomy = get_default_taxonomy()
+    return skill_cache.get_or_compute(text, taxonomy.digest, lambda t: frozenset(taxonomy.extract(t)))
+
+
+@dataclass(frozen=True)
+class JobSkillProfile:
+    """
+    A JD's skill set extracted once, for comparing many resumes against it.
+
+    `skills` is kept sorted so each comparison is a membership scan over the
+    JD skills, with no per-resume sort and no re-parsing of the JD.
+    """
+
+    skills: Tuple[str, ...]
+
+    @classmethod
+    def from_text(cls, job_description_clean: str) -> "JobSkillProfile":
+        return cls(skills=tuple(sorted(_tokenize_skills(job_description_clean))))
+
+    def compare(self, resume_clean: str) -> Dict[str, List[str]]:
+        return self.compare_skills(_tokenize_skills(resume_clean))
+
+    def compare_skills(self, resume_skills: AbstractSet[str]) -> Dict[str, List[str]]:
+        return {
+            "matched_skills": [s for s in self.skills if s in resume_skills],
+            "missing_skills": [s for s in self.skills if s not in resume_skills],
+        }
+
+    def compare_many(self, resumes_clean: Iterable[str]) -> List[Dict[str, List[str]]]:
+        return [self.compare_skills(_tokenize_skills(resume)) for resume in resumes_clean]
+
+
+_POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+@dataclass
+class SkillMatrix:
+    """
+    Candidate pool x taxonomy skill presence, one bit per (candidate, skill).
+
+    `bits` is the N x ceil(S / 8) np.packbits form of the boolean matrix over
+    `skill_names`. Matched/missing against a JD is a row-wise AND / AND-NOT with
+    the JD's packed mask, and pool statistics are column sums, so nothing is
+    computed per candidate in Python.
+    """
+
+    skill_names: List[str]
+    bits: np.ndarray
+
+    @classmethod
+    def from_texts(cls, resumes_clean: Iterable[str], skill_names: Optional[Sequence[str]] = None) -> "SkillMatrix":
+        if skill_names is None:
+            skill_names = get_default_taxonomy().names()
+        index = {name: col for col, name in enumerate(skill_names)}
+        rows = [_tokenize_skills(resume) for resume in resumes_clean]
+        presence = np.zeros((len(rows), len(skill_names)), dtype=bool)
+        for row, skills in enumerate(rows):
+            presence[row, [index[s] for s in skills if s in index]] = True
+        return cls(skill_names=list(skill_names), bits=np.packbits(presence, axis=1))
+
+    def __len__(self) -> int:
+        return self.bits.shape[0]
+
+    def mask(self, skills: Iterable[str]) -> np.ndarray:
+        """Packed row mask for a skill set (e.g. a JobSkillProfile's skills)."""
+        wanted = set(skills)
+        return np.packbits(np.array([name in wanted for name in self.skill_names], dtype=bool))
+
+    def presence(self) -> np.ndarray:
+        return np.unpackbits(self.bits, axis=1, count=len(self.skill_names)).astype(bool)
+
+    def matched_bits(self, profile: JobSkillProfile) -> np.ndarray:
+        return self.bits & self.mask(profile.skills)
+
+    def missing_bits(self, profile: JobSkillProfile) -> np.ndarray:
+        return ~self.bits & self.mask(profile.skills)
+
+    def coverage_percent(self, profile: JobSkillProfile) -> np.ndarray:
+        """Share of the JD's skills each candidate has, 0-100 (100 for a JD with no skills)."""
+        wanted = int(_POPCOUNT[self.mask(profile.skills)].sum())
+        if not wanted:
+            return np.full(len(self), 100.0)
+        matched = _POPCOUNT[self.matched_bits(profile)].sum(axis=1, dtype=np.int64)
+        return np.round(matched * 100.0 / wanted, 2)
+
+    def candidate_counts(self) -> np.ndarray:
+        """Number of candidates holding each skill, aligned with `skill_names`."""
+        return self.presence().sum(axis=0)
+
+    def _profile_columns(self, profile: JobSkillProfile) -> np.ndarray:
+        return np.unpackbits(self.mask(profile.skills), count=len(self.skill_names)).astype(bool)
+
+    def pool_coverage(self, profile: JobSkillProfile) -> Dict[str, float]:
+        """Percent of the pool holding each of the JD's skills."""
+        cols = self._profile_columns(profile)
+        if not len(self):
+            return {}
+        share = self.presence()[:, cols].mean(axis=0) * 100
+        return dict(zip(np.asarray(self.skill_names, dtype=object)[cols], np.round(share, 2).tolist()))
+
+    def gap_lists(self, profile: JobSkillProfile) -> List[Dict[str, List[str]]]:
+        """Per-candidate matched/missing skill names, as JobSkillProfile.compare_many returns."""
+        cols = self._profile_columns(profile)
+        names = np.asarray(self.skill_names, dtype=object)[cols]
+        have = self.presence()[:, cols]
+        return [{"matched_skills": list(names[row]), "missing_skills": list(names[~row])} for row in have]
 
 
 def get_skill_match_details(job_description_clean: str, resume_clean: str) -> Dict[str, List[str]]:
-    jd_skills = _tokenize_skills(job_description_clean)
-    resume_skills = _tokenize_skills(resume_clean)
+    return JobSkillProfile.from_text(job_description_clean).compare(resume_clean)
 
-    matched = sorted(jd_skills & resume_skills)
-    missing = sorted(jd_skills - resume_skills)
 
+def get_keyword_gap(job_description_clean: str, resume_clean: str, limit: int = 10) -> Dict[str, List[str]]:
+    """The JD's top keywords by background TF-IDF, split by whether the resume uses them."""
+    resume_terms = set(tokenize(resume_clean))
+    keywords = extract_keywords(job_description_clean, limit)
     return {
-        "matched_skills": matched,
-        "missing_skills": missing,
+        "matched_keywords": [k for k in keywords if k in resume_terms],
+        "missing_keywords": [k for k in keywords if k not in resume_terms],
     }
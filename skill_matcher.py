@@ -0,0 +1,146 @@
+import re
+from array import array
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Set, Tuple
+
+# Characters skill_gap tokens are made of (after lower()); also the automaton's alphabet.
+TOKEN_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789+#.-"
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9+#.-]+")
+_ALPHABET = len(TOKEN_CHARS)
+_CODES = bytes(TOKEN_CHARS.index(chr(c)) if chr(c) in TOKEN_CHARS else 0 for c in range(256))
+
+
+def _normalize_phrase(phrase: str) -> str:
+    return " ".join(phrase.lower().split())
+
+
+class SkillMatcher:
+    """
+    Compiled skill taxonomy: single-token skills, multi-word phrases and aliases.
+
+    Matches exactly what skill_gap's per-phrase scan did, in one pass per
+    document. A phrase counts as present when every word appears as a token, or
+    when its words run together inside the concatenated token stream
+    ("machinelearning", "machine learning" split across tokens). The second
+    check covers the old word-boundary phrase search, so it is the only
+    substring search left and runs as an Aho-Corasick automaton over the
+    40-character token alphabet. Phrases using characters outside that
+    alphabet keep the original regex.
+    """
+
+    def __init__(
+        self,
+        skills: Iterable[str] = (),
+        phrases: Iterable[str] = (),
+        aliases: Mapping[str, str] = None,
+    ):
+        self.skills: FrozenSet[str] = frozenset(s.lower() for s in skills)
+        aliases = {_normalize_phrase(k): _normalize_phrase(v) for k, v in (aliases or {}).items()}
+        # Single-token aliases are looked up per token; multi-word ones are matched
+        # like phrases and reported under their canonical name.
+        self.aliases: Dict[str, str] = {k: v for k, v in aliases.items() if " " not in k}
+        phrase_names = {_normalize_phrase(p): _normalize_phrase(p) for p in phrases if p.strip()}
+        phrase_names.update({k: v for k, v in aliases.items() if " " in k})
+        self.phrases: Tuple[str, ...] = tuple(sorted(phrase_names))
+        self._phrase_names: Tuple[str, ...] = tuple(phrase_names[p] for p in self.phrases)
+
+        self._phrase_words: List[FrozenSet[str]] = [frozenset(p.split()) for p in self.phrases]
+        self._word_phrases: Dict[str, List[int]] = {}
+        for pid, words in enumerate(self._phrase_words):
+            for word in words:
+                self._word_phrases.setdefault(word, []).append(pid)
+        self._phrase_parts: Dict[str, Tuple[str, ...]] = {
+            p: tuple(p.split()) for p in set(self._phrase_names) | set(self.aliases.values())
+        }
+        for phrase, name in zip(self.phrases, self._phrase_names):
+            if phrase != name:
+                self._phrase_parts[name] = self._phrase_parts[name] + tuple(phrase.split())
+
+        merged = []
+        self._regex_phrases: List[Tuple[int, "re.Pattern"]] = []
+        for pid, phrase in enumerate(self.phrases):
+            pattern = phrase.replace(" ", "")
+            if all(ch in TOKEN_CHARS for ch in pattern):
+                merged.append((pid, pattern))
+            else:
+                self._regex_phrases.append((pid, re.compile(rf"\b{re.escape(phrase)}\b")))
+        self._build_automaton(merged)
+
+    def _build_automaton(self, patterns: List[Tuple[int, str]]):
+        goto: List[Dict[int, int]] = [{}]
+        out: List[Set[int]] = [set()]
+        for pid, pattern in patterns:
+            state = 0
+            for code in pattern.encode("ascii").translate(_CODES):
+                nxt = goto[state].get(code)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][code] = nxt
+                    goto.append({})
+                    out.append(set())
+                state = nxt
+            out[state].add(pid)
+
+        # Dense DFA: delta[state * _ALPHABET + code] is the next state times _ALPHABET,
+        # so the scan loop needs a single array lookup per character.
+        n_states = len(goto)
+        delta = array("i", [0]) * (n_states * _ALPHABET)
+        fail = [0] * n_states
+        queue = deque()
+        for code, nxt in goto[0].items():
+            delta[code] = nxt * _ALPHABET
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            out[state] |= out[fail[state]]
+            base = state * _ALPHABET
+            fail_base = fail[state] * _ALPHABET
+            for code in range(_ALPHABET):
+                nxt = goto[state].get(code)
+                if nxt is None:
+                    delta[base + code] = delta[fail_base + code]
+                else:
+                    fail[nxt] = delta[fail_base + code] // _ALPHABET
+                    delta[base + code] = nxt * _ALPHABET
+                    queue.append(nxt)
+
+        self._delta = delta
+        self._outputs: List[Tuple[int, ...]] = [tuple(sorted(o)) for o in out]
+        self.n_states = n_states
+
+    def _merged_matches(self, joined: str) -> Set[int]:
+        delta = self._delta
+        outputs = self._outputs
+        found: Set[int] = set()
+        state = 0
+        for code in joined.encode("ascii").translate(_CODES):
+            state = delta[state + code]
+            hit = outputs[state // _ALPHABET]
+            if hit:
+                found.update(hit)
+        return found
+
+    def extract(self, text: str) -> Set[str]:
+        """Skills present in `text` (same result as the original skill_gap scan)."""
+        text_l = text.lower()
+        tokens = _TOKEN_RE.findall(text_l)
+        token_set = set(tokens)
+
+        hits = self._merged_matches("".join(tokens))
+        seen: Dict[int, int] = {}
+        for token in token_set:
+            for pid in self._word_phrases.get(token, ()):
+                seen[pid] = seen.get(pid, 0) + 1
+        hits.update(pid for pid, n in seen.items() if n == len(self._phrase_words[pid]))
+        for pid, regex in self._regex_phrases:
+            if pid not in hits and regex.search(text_l):
+                hits.add(pid)
+
+        matched: Set[str] = {self._phrase_names[pid] for pid in hits}
+        matched.update(self.aliases[t] for t in token_set if t in self.aliases)
+
+        token_matches = {t for t in token_set if t in self.skills}
+        # If a phrase is present, suppress its component single-word tokens.
+        for phrase in matched:
+            token_matches.difference_update(self._phrase_parts.get(phrase) or phrase.split())
+        return matched | token_matches
@@ -0,0 +1,213 @@
+import csv
+import hashlib
+import io
+import json
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from cache_paths import owned_privately, private_dir
+from skill_matcher import SkillMatcher
+
+TAXONOMY_PATH_ENV = "ATS_SKILL_TAXONOMY"
+CACHE_DIR_ENV = "ATS_TAXONOMY_CACHE_DIR"
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skills_taxonomy.json")
+# Bump when SkillTaxonomy or SkillMatcher internals change so stale pickles are rebuilt.
+COMPILED_FORMAT_VERSION = 1
+
+
+@dataclass
+class SkillEntry:
+    name: str
+    category: str = "technical"
+    aliases: List[str] = field(default_factory=list)
+    parents: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SkillTaxonomy:
+    """
+    Skills with categories, aliases and parent skills, plus the SkillMatcher
+    compiled from them. `digest` is the SHA-256 of the source file.
+    """
+
+    entries: Dict[str, SkillEntry]
+    digest: str
+    matcher: SkillMatcher
+
+    @classmethod
+    def from_entries(cls, entries: List[SkillEntry], digest: str) -> "SkillTaxonomy":
+        by_name: Dict[str, SkillEntry] = {}
+        for entry in entries:
+            name = " ".join(entry.name.lower().split())
+            if not name:
+                continue
+            if name in by_name:
+                raise ValueError(f"Skill {name!r} is listed twice in the taxonomy.")
+            by_name[name] = SkillEntry(
+                name=name,
+                category=entry.category.strip().lower() or "technical",
+                aliases=[" ".join(a.lower().split()) for a in entry.aliases if a.strip()],
+                parents=[" ".join(p.lower().split()) for p in entry.parents if p.strip()],
+            )
+        for entry in by_name.values():
+            unknown = [p for p in entry.parents if p not in by_name]
+            if unknown:
+                raise ValueError(f"Skill {entry.name!r} has unknown parent(s): {', '.join(unknown)}.")
+
+        aliases = {alias: entry.name for entry in by_name.values() for alias in entry.aliases}
+        matcher = SkillMatcher(
+            skills=[name for name in by_name if " " not in name],
+            phrases=[name for name in by_name if " " in name],
+            aliases=aliases,
+        )
+        return cls(entries=by_name, digest=digest, matcher=matcher)
+
+    def extract(self, text: str) -> Set[str]:
+        return self.matcher.extract(text)
+
+    def names(self, category: Optional[str] = None) -> List[str]:
+        return sorted(n for n, e in self.entries.items() if category is None or e.category == category)
+
+    def category(self, name: str) -> Optional[str]:
+        entry = self.entries.get(name)
+        return entry.category if entry else None
+
+    def ancestors(self, name: str) -> Set[str]:
+        """All parent skills of `name`, transitively."""
+        found: Set[str] = set()
+        stack = list(self.entries[name].parents) if name in self.entries else []
+        while stack:
+            parent = stack.pop()
+            if parent not in found:
+                found.add(parent)
+                stack.extend(self.entries[parent].parents)
+        return found
+
+
+def _split_list(value: str) -> List[str]:
+    return [v.strip() for v in (value or "").split(";") if v.strip()]
+
+
+def parse_taxonomy(data: bytes, fmt: str) -> List[SkillEntry]:
+    """
+    JSON: {"skills": [{"name", "category", "aliases": [...], "parents": [...]}]}.
+    CSV: columns name, category, aliases, parents; list cells are ';'-separated.
+    """
+    if fmt == "json":
+        doc = json.loads(data.decode("utf-8"))
+        rows = doc["skills"] if isinstance(doc, dict) else doc
+        return [
+            SkillEntry(
+                name=row["name"],
+                category=row.get("category", "technical"),
+                aliases=list(row.get("aliases", [])),
+                parents=list(row.get("parents", [])),
+            )
+            for row in rows
+        ]
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+        return [
+            SkillEntry(
+                name=row["name"],
+                category=row.get("category") or "technical",
+                aliases=_split_list(row.get("aliases")),
+                parents=_split_list(row.get("parents")),
+            )
+            for row in reader
+        ]
+    raise ValueError(f"Unsupported taxonomy format {fmt!r}; use .json or .csv.")
+
+
+def _cache_path(cache_dir: str, digest: str) -> str:
+    return os.path.join(cache_dir, f"{digest}-v{COMPILED_FORMAT_VERSION}.pkl")
+
+
+def _load_compiled(cache_dir: Optional[str], digest: str) -> Optional[SkillTaxonomy]:
+    if not cache_dir:
+        return None
+    try:
+        # Unpickling runs code, so only read files nobody else could have written.
+        if not owned_privately(os.stat(cache_dir)):
+            return None
+        with open(_cache_path(cache_dir, digest), "rb") as fh:
+            if not owned_privately(os.fstat(fh.fileno())):
+                return None
+            taxonomy = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A truncated or incompatible pickle is treated as a miss and recompiled.
+        return None
+    return taxonomy if isinstance(taxonomy, SkillTaxonomy) and taxonomy.digest == digest else None
+
+
+def _save_compiled(cache_dir: Optional[str], taxonomy: SkillTaxonomy):
+    if not cache_dir:
+        return
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(taxonomy, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _cache_path(cache_dir, taxonomy.digest))
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_taxonomy(path: str = DEFAULT_TAXONOMY_PATH, cache_dir: Optional[str] = None) -> SkillTaxonomy:
+    """
+    Load a JSON or CSV taxonomy. With a `cache_dir`, the compiled form is
+    pickled there keyed by the file's SHA-256, so later processes skip
+    compilation entirely. Cached pickles are only loaded when the directory and
+    file belong to the current user and are not group/world writable.
+    """
+    with open(path, "rb") as fh:
+        data = fh.read()
+    digest = hashlib.sha256(data).hexdigest()
+    taxonomy = _load_compiled(cache_dir, digest)
+    if taxonomy is None:
+        fmt = os.path.splitext(path)[1].lstrip(".").lower()
+        taxonomy = SkillTaxonomy.from_entries(parse_taxonomy(data, fmt), digest)
+        _save_compiled(cache_dir, taxonomy)
+    return taxonomy
+
+
+_default_taxonomy: Optional[SkillTaxonomy] = None
+_default_lock = threading.Lock()
+
+
+def _default_cache_dir() -> Optional[str]:
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return None if configured.lower() == "off" else configured
+    try:
+        return private_dir("taxonomy")
+    except OSError:
+        return None
+
+
+def get_default_taxonomy() -> SkillTaxonomy:
+    """
+    Process-wide taxonomy: ATS_SKILL_TAXONOMY (JSON/CSV path) or the bundled
+    data/skills_taxonomy.json. Compiled matchers are cached in the per-user
+    cache dir (cache_paths.private_dir); ATS_TAXONOMY_CACHE_DIR overrides the
+    location, or disables the cache when set to "off".
+    """
+    global _default_taxonomy
+    with _default_lock:
+        if _default_taxonomy is None:
+            _default_taxonomy = load_taxonomy(
+                os.environ.get(TAXONOMY_PATH_ENV) or DEFAULT_TAXONOMY_PATH,
+                _default_cache_dir(),
+            )
+        return _default_taxonomy
+
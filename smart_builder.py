@@ -1,99 +1,44 @@
 import re
-from collections import Counter
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
-
-TECH_PHRASES = [
-    "machine learning",
-    "data science",
-    "artificial intelligence",
-    "natural language processing",
-    "deep learning",
-    "computer vision",
-    "data analysis",
-    "data engineering",
-    "power bi",
-    "scikit-learn",
-    "streamlit",
-    "tableau",
-    "postgresql",
-    "mysql",
-    "mongodb",
-    "pytorch",
-    "tensorflow",
-    "python",
-    "java",
-    "sql",
-    "aws",
-    "azure",
-    "gcp",
-    "docker",
-    "kubernetes",
-    "rag",
-    "faiss",
-    "transformers",
-]
-
-SOFT_PHRASES = [
-    "communication",
-    "leadership",
-    "problem solving",
-    "critical thinking",
-    "collaboration",
-    "teamwork",
-    "stakeholder management",
-    "adaptability",
-    "time management",
-    "attention to detail",
-]
+from content_cache import ContentCache
+from keyword_extractor import extract_keywords
+from skill_taxonomy import get_default_taxonomy
 
 
 def _normalize(text: str) -> str:
     return re.sub(r"\s+", " ", text.lower()).strip()
 
 
-def _extract_matches(text: str, phrases: List[str]) -> List[str]:
-    text_l = _normalize(text)
-    matches = []
-    for phrase in phrases:
-        if re.search(rf"\b{re.escape(phrase)}\b", text_l):
-            matches.append(phrase)
-    return sorted(set(matches))
-
-
-def _extract_top_terms(text: str, limit: int = 10) -> List[str]:
-    tokens = re.findall(r"[a-zA-Z][a-zA-Z0-9+#.-]+", text.lower())
-    stop = {
-        "with",
-        "from",
-        "that",
-        "this",
-        "have",
-        "will",
-        "your",
-        "their",
-        "using",
-        "ability",
-        "strong",
-        "experience",
-        "knowledge",
-        "skills",
-        "skill",
-        "years",
-        "year",
-        "for",
-        "and",
-        "the",
-        "you",
-        "are",
-        "our",
-        "into",
-        "role",
-        "job",
-    }
-    filt = [t for t in tokens if t not in stop and len(t) > 2]
-    freq = Counter(filt)
-    return [w for w, _ in freq.most_common(limit)]
+_TERM_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9+#.-]+")
+
+
+@dataclass(frozen=True)
+class JobDescriptionProfile:
+    """JD-dependent half of the suggestions: computed once per JD text, then cached."""
+
+    technical: Tuple[str, ...]
+    soft: Tuple[str, ...]
+
+    @classmethod
+    def from_text(cls, job_description: str) -> "JobDescriptionProfile":
+        taxonomy = get_default_taxonomy()
+        skills = sorted(taxonomy.extract(job_description))
+        technical = [s for s in skills if taxonomy.category(s) == "technical"]
+        soft = [s for s in skills if taxonomy.category(s) == "soft"]
+        if not technical:
+            technical = extract_keywords(job_description, limit=8)
+        return cls(technical=tuple(technical), soft=tuple(soft))
+
+
+# Keyed by a hash of the raw JD, so Resume Builder reruns only redo the user-dependent parts.
+_profile_cache = ContentCache(weigh=lambda p: sum(len(s) for s in p.technical + p.soft), max_entries=256)
+
+
+def get_job_profile(job_description: str) -> JobDescriptionProfile:
+    taxonomy = get_default_taxonomy()
+    return _profile_cache.get_or_compute(job_description or "", taxonomy.digest, JobDescriptionProfile.from_text)
 
 
 def _collect_user_skills(data: Dict) -> List[str]:
@@ -104,7 +49,7 @@ def _collect_user_skills(data: Dict) -> List[str]:
         values.extend([s.strip().lower() for s in str(row.get("Tech", "")).split(",") if s.strip()])
 
     for row in data.get("experience_rows", []):
-        values.extend(re.findall(r"[a-zA-Z][a-zA-Z0-9+#.-]+", str(row.get("Achievements", "")).lower()))
+        values.extend(_TERM_RE.findall(str(row.get("Achievements", "")).lower()))
 
     return sorted(set(values))
 
@@ -190,11 +135,9 @@ def _rewrite_star_experience(data: Dict, jd_tech: List[str], jd_soft: List[str])
 
 
 def generate_smart_builder_suggestions(user_data: Dict, job_description: str) -> Dict:
-    jd = job_description or ""
-    jd_tech = _extract_matches(jd, TECH_PHRASES)
-    jd_soft = _extract_matches(jd, SOFT_PHRASES)
-    if not jd_tech:
-        jd_tech = _extract_top_terms(jd, limit=8)
+    profile = get_job_profile(job_description)
+    jd_tech = list(profile.technical)
+    jd_soft = list(profile.soft)
 
     user_skills = _collect_user_skills(user_data)
     user_skill_text = " ".join(user_skills)
@@ -1,16 +1,226 @@
+import json
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.linear_model import SGDClassifier
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
 from sklearn.pipeline import Pipeline
 from sklearn.svm import SVC
 
+from ats_results import BatchPrediction, PredictionResult, TermContributions, batch_from_probs, calibrate, sigmoid
+
+ENGINES = ("svm", "linear", "sgd")
+FEATURES = ("tfidf", "hashing")
+DEFAULT_HASH_FEATURES = 2 ** 18
+EXPORT_FORMAT_VERSION = 1
+
 
 @dataclass
-class PredictionResult:
-    label: str
-    score_percent: float
-    confidence_percent: float
+class LinearParams:
+    """
+    A fitted matcher reduced to its linear form.
+
+    P(match) = calibrate(decision, prob_a, prob_b, calibration), where decision
+    is the L2-normalised TF-IDF resume vector dotted with `coef`, plus
+    `intercept`. `vocabulary` is None for hashed features, whose columns are
+    hash buckets.
+    """
+
+    vocabulary: Optional[Dict[str, int]]
+    idf: np.ndarray
+    coef: np.ndarray
+    intercept: float
+    prob_a: float
+    prob_b: float
+    calibration: str = "sigmoid"
+
+
+def _column_weights(
+    p: LinearParams, vocabulary: Optional[Dict[str, int]], n_terms: int, columns: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """IDF and coefficient arrays for the (sorted) `columns` of an n_terms-wide count matrix."""
+    if p.vocabulary is None:
+        if len(p.idf) != n_terms:
+            raise ValueError("Hashed counts and matcher use different feature spaces.")
+        return p.idf[columns], p.coef[columns]
+
+    idf = np.zeros(len(columns))
+    coef = np.zeros(len(columns))
+    known = [(vocabulary[term], col) for term, col in p.vocabulary.items() if term in vocabulary]
+    if known:
+        rows, cols = (np.array(side, dtype=np.int64) for side in zip(*known))
+        positions = np.minimum(np.searchsorted(columns, rows), max(len(columns) - 1, 0))
+        used = columns[positions] == rows if len(columns) else np.zeros(len(rows), dtype=bool)
+        idf[positions[used]] = p.idf[cols[used]]
+        coef[positions[used]] = p.coef[cols[used]]
+    return idf, coef
+
+
+def _used_columns(counts: sp.csr_matrix) -> Tuple[np.ndarray, sp.csr_matrix]:
+    """Sorted columns holding any count, and `counts` narrowed to them."""
+    columns = np.unique(counts.indices)
+    return columns, counts[:, columns]
+
+
+def _column_name(names, col) -> str:
+    # Hashed columns are named from known terms only; feedback can weight buckets
+    # for terms nobody has named yet, which are labelled by bucket number.
+    if isinstance(names, dict):
+        return names.get(col, f"#{col}")
+    return names[col]
+
+
+def _top_candidates(values: np.ndarray, top_n: int) -> np.ndarray:
+    """Positions of the top_n largest values, plus any tied with the last one."""
+    if len(values) <= top_n:
+        return np.arange(len(values))
+    cutoff = np.partition(values, len(values) - top_n)[len(values) - top_n]
+    return np.flatnonzero(values >= cutoff)
+
+
+def _top_terms(contributions: sp.csr_matrix, names, top_n: int) -> Tuple[TermContributions, TermContributions]:
+    """
+    Per-row largest positive and most negative entries of a contribution matrix.
+
+    `names` may also be a callable taking {row: candidate columns} and returning
+    a column -> term dict, so that only the columns that can make a row's top
+    `top_n` are looked up.
+    """
+    contributions = sp.csr_matrix(contributions)
+    candidates: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    for i in range(contributions.shape[0]):
+        start, end = contributions.indptr[i], contributions.indptr[i + 1]
+        cols = contributions.indices[start:end]
+        vals = contributions.data[start:end]
+        pos, neg = np.flatnonzero(vals > 0), np.flatnonzero(vals < 0)
+        # Ties at the cut are kept so the (value, term) order below is unchanged.
+        keep = np.concatenate([pos[_top_candidates(vals[pos], top_n)], neg[_top_candidates(-vals[neg], top_n)]])
+        candidates[i] = (cols[keep], vals[keep])
+    if callable(names):
+        names = names({i: cols for i, (cols, _) in candidates.items()})
+
+    positive: TermContributions = []
+    negative: TermContributions = []
+    for i in range(contributions.shape[0]):
+        cols, vals = candidates[i]
+        entries = [(_column_name(names, col), float(val)) for col, val in zip(cols, vals)]
+        pos = sorted((e for e in entries if e[1] > 0), key=lambda e: (-e[1], e[0]))[:top_n]
+        neg = sorted((e for e in entries if e[1] < 0), key=lambda e: (e[1], e[0]))[:top_n]
+        positive.append([(term, round(val, 4)) for term, val in pos])
+        negative.append([(term, round(val, 4)) for term, val in neg])
+    return positive, negative
+
+
+def score_term_counts(counts, vocabulary: Dict[str, int], params: List[LinearParams]) -> np.ndarray:
+    """
+    Match probabilities for N count vectors against M fitted matchers at once.
+
+    `counts` is an N x V sparse matrix of raw n-gram counts; `vocabulary` maps
+    terms to its columns and only needs to contain terms the matchers know
+    (anything else scores as absent). For hashed-feature matchers `counts` must
+    come from hash_term_counts and `vocabulary` is ignored. Per-matcher IDF
+    weighting and L2 normalisation are folded into two V x M weight matrices,
+    so the whole N x M grid costs two sparse products.
+    """
+    counts = sp.csr_matrix(counts, dtype=float)
+    n_terms = counts.shape[1]
+    # Weights are laid out over the columns these rows use, not the full width
+    # (a store-wide term table or 2**18 hash buckets).
+    columns, counts = _used_columns(counts)
+    weights = np.zeros((len(columns), len(params)))
+    idf_sq = np.zeros((len(columns), len(params)))
+    for j, p in enumerate(params):
+        idf, coef = _column_weights(p, vocabulary, n_terms, columns)
+        weights[:, j] = idf * coef
+        idf_sq[:, j] = idf ** 2
+
+    numer = np.asarray(counts @ weights)
+    norms = np.sqrt(np.asarray(counts.multiply(counts) @ idf_sq))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        decision = np.where(norms > 0, numer / norms, 0.0)
+    decision += np.array([p.intercept for p in params])
+    return np.column_stack(
+        [calibrate(decision[:, j], p.prob_a, p.prob_b, p.calibration) for j, p in enumerate(params)]
+    ).reshape(decision.shape)
+
+
+def _hashing_vectorizer(ngram_range: Tuple[int, int], n_features: int) -> HashingVectorizer:
+    return HashingVectorizer(ngram_range=ngram_range, n_features=n_features, alternate_sign=False, norm=None)
+
+
+def hash_term_counts(
+    texts: Iterable[str], ngram_range: Tuple[int, int] = (1, 2), n_features: int = DEFAULT_HASH_FEATURES
+) -> sp.csr_matrix:
+    """
+    Raw n-gram counts in a fixed hashed feature space.
+
+    Needs no fitted state, so any worker can compute these once, store them and
+    score them later against any hashing matcher with the same settings.
+    """
+    return _hashing_vectorizer(tuple(ngram_range), n_features).transform(texts)
+
+
+def hash_buckets(terms: List[str], n_features: int = DEFAULT_HASH_FEATURES) -> np.ndarray:
+    """Hashed column of each already-formed n-gram term (as used by hash_term_counts)."""
+    hasher = HashingVectorizer(analyzer=lambda term: [term], n_features=n_features, alternate_sign=False, norm=None)
+    return hasher.transform(terms).indices.astype(np.int64)
+
+
+def idf_from_counts(counts) -> np.ndarray:
+    """Smoothed IDF (same formula as sklearn's TfidfTransformer) from a count matrix."""
+    counts = sp.csr_matrix(counts)
+    n_docs = counts.shape[0]
+    doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+    return np.log((1.0 + n_docs) / (1.0 + doc_freq)) + 1.0
+
+
+def _logit(p: float) -> float:
+    return float(np.log(p / (1.0 - p)))
+
+
+class CosineCentroidClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Closed-form linear scorer for the "linear" engine.
+
+    The decision value is the cosine between a (L2-normalised TF-IDF) resume
+    and the centroid of the positive training rows. Probabilities come from a
+    sigmoid fitted exactly through the positive and negative class means using
+    Platt's prior-corrected targets, so there is no cross-validation and no
+    randomness: fitting is two means and a norm, scoring is one sparse dot.
+    """
+
+    def fit(self, X, y):
+        y = np.asarray(y)
+        self.classes_ = np.array([0, 1])
+        centroid = np.asarray(X[y == 1].mean(axis=0)).ravel()
+        norm = np.linalg.norm(centroid)
+        self.coef_ = centroid / norm if norm > 0 else centroid
+        self.intercept_ = 0.0
+
+        decisions = self.decision_function(X)
+        n_pos = int((y == 1).sum())
+        n_neg = int((y == 0).sum())
+        pos_mean = float(decisions[y == 1].mean())
+        neg_mean = float(decisions[y == 0].mean()) if n_neg else 0.0
+        pos_target = _logit((n_pos + 1.0) / (n_pos + 2.0))
+        neg_target = _logit(1.0 / (n_neg + 2.0))
+        spread = max(pos_mean - neg_mean, 1e-12)
+        self.prob_a_ = (pos_target - neg_target) / spread
+        self.prob_b_ = neg_target - self.prob_a_ * neg_mean
+        return self
+
+    def decision_function(self, X) -> np.ndarray:
+        return np.asarray(X @ self.coef_).ravel() + self.intercept_
+
+    def predict_proba(self, X) -> np.ndarray:
+        pos = sigmoid(self.prob_a_ * self.decision_function(X) + self.prob_b_)
+        return np.column_stack([1.0 - pos, pos])
+
+    def predict(self, X) -> np.ndarray:
+        return (self.predict_proba(X)[:, 1] >= 0.5).astype(int)
 
 
 class ATSMatcher:
@@ -19,16 +229,65 @@ class ATSMatcher:
 
     We create a lightweight training set from the JD itself and a synthetic
     negative sample so the model can estimate match probability robustly.
+
+    `engine="svm"` (default) uses a Platt-calibrated linear SVC. `engine="linear"`
+    swaps in CosineCentroidClassifier, which fits without internal
+    cross-validation and returns the same PredictionResult shape.
+
+    `engine="sgd"` is a logistic-loss SGDClassifier that keeps learning from
+    recruiter feedback through partial_fit; pair it with `features="hashing"`
+    so terms that only appear in feedback resumes still get weights.
+
+    `features="hashing"` replaces the JD-learned TF-IDF vocabulary with a fixed
+    hashed feature space (see hash_term_counts) and keeps IDF as a plain array
+    that can be replaced with set_idf.
     """
 
-    def __init__(self):
-        self.pipeline = Pipeline(
-            steps=[
-                ("tfidf", TfidfVectorizer(ngram_range=(1, 2), max_features=7000)),
-                ("svm", SVC(kernel="linear", probability=True, random_state=42)),
+    def __init__(
+        self,
+        ngram_range: Tuple[int, int] = (1, 2),
+        max_features: int = 7000,
+        engine: str = "svm",
+        features: str = "tfidf",
+        n_features: int = DEFAULT_HASH_FEATURES,
+    ):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}.")
+        if features not in FEATURES:
+            raise ValueError(f"Unknown features {features!r}; expected one of {FEATURES}.")
+        self.ngram_range = tuple(ngram_range)
+        self.max_features = max_features
+        self.engine = engine
+        self.features = features
+        self.n_features = n_features
+        if engine == "svm":
+            classifier = ("svm", SVC(kernel="linear", probability=True, random_state=42))
+        elif engine == "sgd":
+            classifier = ("sgd", SGDClassifier(loss="log_loss", random_state=42))
+        else:
+            classifier = ("linear", CosineCentroidClassifier())
+        if features == "tfidf":
+            vectorizer_steps = [("tfidf", TfidfVectorizer(ngram_range=self.ngram_range, max_features=self.max_features))]
+        else:
+            vectorizer_steps = [
+                ("hashing", _hashing_vectorizer(self.ngram_range, self.n_features)),
+                ("tfidf", TfidfTransformer()),
             ]
-        )
+        self.pipeline = Pipeline(steps=vectorizer_steps + [classifier])
         self._is_fitted = False
+        self._linear_params = None
+        self._training_data = None
+        self.feedback_count = 0
+
+    @property
+    def config(self) -> Dict:
+        """Constructor arguments; two matchers with equal config fit identically."""
+        config = {"ngram_range": list(self.ngram_range), "engine": self.engine, "features": self.features}
+        if self.features == "tfidf":
+            config["max_features"] = self.max_features
+        else:
+            config["n_features"] = self.n_features
+        return config
 
     @staticmethod
     def _build_training_data(job_text: str) -> Tuple[List[str], List[int]]:
@@ -52,16 +311,253 @@ class ATSMatcher:
         X_train, y_train = self._build_training_data(job_description_clean)
         self.pipeline.fit(X_train, y_train)
         self._is_fitted = True
+        self._linear_params = None
+        self._training_data = (X_train, y_train)
+        self.feedback_count = 0
+
+    def partial_fit(self, resumes_clean: Iterable[str], labels: Iterable[int]):
+        """
+        Absorb labelled recruiter feedback (1 = shortlisted, 0 = rejected)
+        into a fitted `engine="sgd"` matcher without refitting from scratch.
+        """
+        if self.engine != "sgd":
+            raise ValueError("partial_fit is only available with engine='sgd'.")
+        if not self._is_fitted:
+            raise RuntimeError("Model must be fitted before absorbing feedback.")
+        texts = list(resumes_clean)
+        y = np.asarray(list(labels), dtype=int)
+        if len(texts) != len(y):
+            raise ValueError("Each feedback resume needs exactly one label.")
+        if not texts:
+            return
+        self.pipeline.steps[-1][1].partial_fit(self.pipeline[:-1].transform(texts), y, classes=np.array([0, 1]))
+        self.feedback_count += len(texts)
+        self._linear_params = None
+
+    def feedback_state(self) -> Dict[str, np.ndarray]:
+        """SGD weights and step counter after partial_fit, as plain arrays (see load_feedback_state)."""
+        if self.engine != "sgd" or not self._is_fitted:
+            raise ValueError("Only a fitted engine='sgd' matcher has feedback state.")
+        sgd = self.pipeline.steps[-1][1]
+        return {
+            "coef": sgd.coef_.copy(),
+            "intercept": sgd.intercept_.copy(),
+            "t": np.array([sgd.t_]),
+            "feedback_count": np.array([self.feedback_count]),
+        }
+
+    def load_feedback_state(self, state: Dict[str, np.ndarray]):
+        """
+        Restore feedback_state() output onto a matcher fitted on the same JD and
+        config, as if the same partial_fit calls had been replayed on it.
+        """
+        if self.engine != "sgd" or not self._is_fitted:
+            raise ValueError("Only a fitted engine='sgd' matcher can load feedback state.")
+        sgd = self.pipeline.steps[-1][1]
+        if np.shape(state["coef"]) != sgd.coef_.shape:
+            raise ValueError("Feedback state does not match this matcher's feature space.")
+        sgd.coef_ = np.array(state["coef"], dtype=float)
+        sgd.intercept_ = np.array(state["intercept"], dtype=float)
+        sgd.t_ = float(state["t"][0])
+        self.feedback_count = int(state["feedback_count"][0])
+        self._linear_params = None
+
+    def set_idf(self, idf: np.ndarray):
+        """
+        Replace the IDF array of a fitted hashing matcher (e.g. with pool-wide
+        statistics from idf_from_counts) and refit the classifier on it.
+        """
+        if self.features != "hashing":
+            raise ValueError("set_idf is only available with features='hashing'.")
+        if not self._is_fitted:
+            raise RuntimeError("Model must be fitted before replacing its IDF.")
+        if self.feedback_count:
+            raise ValueError("set_idf refits on the JD only and would discard absorbed feedback.")
+        idf = np.asarray(idf, dtype=float)
+        if idf.shape != (self.n_features,):
+            raise ValueError(f"IDF must have shape ({self.n_features},).")
+
+        self.pipeline.named_steps["tfidf"].idf_ = idf
+        X_train, y_train = self._training_data
+        self.pipeline.steps[-1][1].fit(self.pipeline[:-1].transform(X_train), y_train)
+        self._linear_params = None
 
     def predict_match(self, resume_clean: str) -> PredictionResult:
+        return self.predict_many([resume_clean]).row(0)
+
+    def predict_many(self, resumes_clean: Iterable[str], explain: int = 0) -> BatchPrediction:
+        """
+        Score many cleaned resumes with a single vectorize + predict_proba pass.
+
+        With `explain=n`, also fill `top_positive`/`top_negative` with each
+        resume's n strongest (term, decision contribution) pairs.
+        """
         if not self._is_fitted:
             raise RuntimeError("Model must be fitted before prediction.")
 
-        probs = self.pipeline.predict_proba([resume_clean])[0]
-        pos_prob = float(probs[1])
-        neg_prob = float(probs[0])
-        score = round(pos_prob * 100, 2)
-        confidence = round(max(pos_prob, neg_prob) * 100, 2)
-        label = "Matched" if score >= 50 else "Not Matched"
+        texts = list(resumes_clean)
+        if not texts:
+            empty = np.empty(0, dtype=float)
+            return BatchPrediction(
+                label=np.empty(0, dtype=object),
+                score_percent=empty,
+                confidence_percent=empty.copy(),
+                top_positive=[] if explain else None,
+                top_negative=[] if explain else None,
+            )
+
+        features = self.pipeline[:-1].transform(texts)
+        probs = self.pipeline.steps[-1][1].predict_proba(features)
+        batch = batch_from_probs(probs[:, 1])
+        if explain:
+            # The model is linear, so each term's share of the decision value is
+            # its TF-IDF weight times its coefficient: one element-wise product.
+            contributions = sp.csr_matrix(features).multiply(self.linear_params().coef)
+            names = lambda wanted: self._feature_names(texts, wanted)
+            batch.top_positive, batch.top_negative = _top_terms(contributions, names, explain)
+        return batch
+
+    def predict_counts(
+        self,
+        counts,
+        vocabulary: Optional[Dict[str, int]] = None,
+        explain: int = 0,
+        names: Optional[Dict[int, str]] = None,
+    ) -> BatchPrediction:
+        """
+        Score pre-counted n-gram vectors (see score_term_counts) without
+        re-tokenizing. For hashed counts, `names` (bucket -> term) labels the
+        explained columns alongside the training terms.
+        """
+        params = self.linear_params()
+        batch = batch_from_probs(score_term_counts(counts, vocabulary, [params])[:, 0])
+        if explain:
+            counts = sp.csr_matrix(counts, dtype=float)
+            n_terms = counts.shape[1]
+            columns, counts = _used_columns(counts)
+            idf, coef = _column_weights(params, vocabulary, n_terms, columns)
+            weighted = counts.multiply(idf).tocsr()
+            norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+            norms[norms == 0] = 1.0
+            contributions = sp.csr_matrix(sp.diags(1.0 / norms) @ weighted.multiply(coef))
+            # Back to the caller's column ids, which the names below refer to.
+            contributions = sp.csr_matrix(
+                (contributions.data, columns[contributions.indices], contributions.indptr),
+                shape=(counts.shape[0], n_terms),
+            )
+            if vocabulary is None:
+                columns = {**(names or {}), **self._feature_names()}
+            else:
+                columns = {col: term for term, col in vocabulary.items()}
+            batch.top_positive, batch.top_negative = _top_terms(contributions, columns, explain)
+        return batch
+
+    def export(self, path: str) -> Tuple[str, str]:
+        """
+        Write the fitted model as `<path>.npz` (terms, IDF, coefficients) and
+        `<path>.json` (intercept, calibration, tokenizer settings) for
+        fast_scorer.ExportedScorer, which loads them without scikit-learn.
+        """
+        if self.features != "tfidf":
+            raise ValueError("Only features='tfidf' can be exported; hashed columns need sklearn's hash function.")
+        params = self.linear_params()
+        tfidf = self.pipeline.named_steps["tfidf"]
 
-        return PredictionResult(label=label, score_percent=score, confidence_percent=confidence)
+        terms = [""] * len(params.vocabulary)
+        for term, col in params.vocabulary.items():
+            terms[col] = term
+        npz_path = f"{path}.npz"
+        json_path = f"{path}.json"
+        np.savez(npz_path, terms=np.array(terms, dtype=str), idf=params.idf, coef=params.coef)
+        meta = {
+            "format_version": EXPORT_FORMAT_VERSION,
+            "engine": self.engine,
+            "ngram_range": list(self.ngram_range),
+            "token_pattern": tfidf.token_pattern,
+            "lowercase": tfidf.lowercase,
+            "intercept": params.intercept,
+            "prob_a": params.prob_a,
+            "prob_b": params.prob_b,
+            "calibration": params.calibration,
+        }
+        with open(json_path, "w", encoding="utf-8") as fh:
+            json.dump(meta, fh, indent=2)
+        return npz_path, json_path
+
+    def _feature_names(self, texts: Sequence[str] = (), wanted: Optional[Dict[int, np.ndarray]] = None):
+        """
+        Column -> term lookup for contributions. Hashed columns are named from
+        the training terms; `wanted` ({row of `texts`: columns}) lists the
+        columns still to name, and only rows holding a column the training
+        terms leave unnamed are re-tokenized to find it.
+        """
+        if self.features == "tfidf":
+            return self.pipeline.named_steps["tfidf"].get_feature_names_out()
+        X_train, _ = self._training_data
+        analyzer = self.term_analyzer()
+        terms = sorted({term for doc in X_train for term in analyzer(doc)})
+        names = dict(zip(hash_buckets(terms, self.n_features).tolist(), terms))
+
+        missing = {
+            row: {col for col in cols.tolist() if col not in names} for row, cols in (wanted or {}).items()
+        }
+        missing = {row: cols for row, cols in missing.items() if cols}
+        if not missing:
+            return names
+        terms = sorted({term for row in missing for term in analyzer(texts[row])})
+        unnamed = set().union(*missing.values())
+        for bucket, term in zip(hash_buckets(terms, self.n_features).tolist(), terms):
+            if bucket in unnamed:
+                names[bucket] = term
+        return names
+
+    def term_analyzer(self):
+        """The n-gram analyzer of the vectorizer step (usable before fitting)."""
+        return self.pipeline.steps[0][1].build_analyzer()
+
+    def linear_params(self) -> LinearParams:
+        """Export the fitted pipeline as vocabulary, IDF, weights and calibration."""
+        if not self._is_fitted:
+            raise RuntimeError("Model must be fitted before exporting parameters.")
+        if getattr(self, "_linear_params", None) is not None:
+            return self._linear_params
+
+        tfidf = self.pipeline.named_steps["tfidf"]
+        clf = self.pipeline.steps[-1][1]
+        coef = clf.coef_
+        if sp.issparse(coef):
+            coef = coef.toarray()
+        coef = np.asarray(coef, dtype=float).ravel()
+
+        if self.engine == "svm":
+            # libsvm's sigmoid is defined on the negated decision value and
+            # returns the probability of the first class.
+            prob_a = -float(clf.probA_[0])
+            prob_b = float(clf.probB_[0])
+            intercept = float(clf.intercept_[0])
+            calibration = "libsvm"
+        elif self.engine == "sgd":
+            # Logistic loss: predict_proba is the plain sigmoid of the decision value.
+            prob_a = 1.0
+            prob_b = 0.0
+            intercept = float(clf.intercept_[0])
+            calibration = "sigmoid"
+        else:
+            prob_a = float(clf.prob_a_)
+            prob_b = float(clf.prob_b_)
+            intercept = float(clf.intercept_)
+            calibration = "sigmoid"
+
+        vocabulary = None
+        if self.features == "tfidf":
+            vocabulary = {term: int(idx) for term, idx in tfidf.vocabulary_.items()}
+        self._linear_params = LinearParams(
+            vocabulary=vocabulary,
+            idf=np.asarray(tfidf.idf_, dtype=float),
+            coef=coef,
+            intercept=intercept,
+            prob_a=prob_a,
+            prob_b=prob_b,
+            calibration=calibration,
+        )
+        return self._linear_params
@@ -1,47 +1,91 @@
-import re
+import hashlib
+import os
 from functools import lru_cache
+from typing import FrozenSet, Iterable, Iterator
+
+from content_cache import ContentCache
+
+DEFAULT_LANGUAGE = "english"
+STOPWORDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "stopwords_english.txt")
+# Bump when _normalize or _clean change what clean_text returns.
+CLEANER_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _get_stopwords(language: str = DEFAULT_LANGUAGE) -> FrozenSet[str]:
+    """
+    English comes from the bundled copy of the NLTK list, so the default path
+    never imports nltk or touches the network. Other languages load nltk lazily.
+    """
+    if language == DEFAULT_LANGUAGE:
+        with open(STOPWORDS_PATH, encoding="utf-8") as fh:
+            return frozenset(line.strip() for line in fh if line.strip())
+
+    import nltk
+    from nltk.corpus import stopwords
 
-import nltk
-from nltk.corpus import stopwords
-
-FALLBACK_STOPWORDS = {
-    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from",
-    "has", "he", "in", "is", "it", "its", "of", "on", "that", "the",
-    "to", "was", "were", "will", "with", "or", "if", "but", "this",
-    "these", "those", "you", "your", "we", "our", "they", "their", "i",
-    "me", "my", "mine", "him", "his", "her", "hers", "them", "what",
-    "which", "who", "whom", "when", "where", "why", "how", "can", "could",
-    "should", "would", "do", "does", "did", "done", "not", "no", "yes",
-    "than", "then", "so", "such", "too", "very", "also", "up", "down",
-    "out", "over", "under", "again", "further", "about", "into", "through",
-    "during", "before", "after", "above", "below", "off", "same", "other",
-    "some", "any", "each", "few", "more", "most", "own", "both", "all",
-}
-
-
-@lru_cache(maxsize=1)
-def _get_stopwords():
-    """Lazy-load stopwords to avoid repeated downloads."""
     try:
-        return set(stopwords.words("english"))
+        return frozenset(stopwords.words(language))
     except LookupError:
-        try:
-            nltk.download("stopwords", quiet=True)
-            return set(stopwords.words("english"))
-        except Exception:
-            return FALLBACK_STOPWORDS
+        nltk.download("stopwords", quiet=True)
+        return frozenset(stopwords.words(language))
+
+
+@lru_cache(maxsize=None)
+def cleaner_fingerprint(language: str = DEFAULT_LANGUAGE) -> str:
+    """Identifies clean_text's output for `language`: CLEANER_VERSION plus a hash of the stopword list."""
+    digest = hashlib.sha256("\n".join(sorted(_get_stopwords(language))).encode("utf-8")).hexdigest()
+    return f"v{CLEANER_VERSION}/{language}/{digest[:16]}"
+
 
+# One byte per ASCII code: [A-Z] lowercased, [a-z0-9] kept, everything else a space.
+_ASCII_NORMALIZE = bytes(
+    c + 32 if 65 <= c <= 90 else c if (48 <= c <= 57 or 97 <= c <= 122) else 32 for c in range(256)
+)
 
-def clean_text(text: str) -> str:
+
+def _normalize(text: str) -> str:
+    """
+    Same result as lower() + re.sub(r"[^a-z0-9\s]", " ") + whitespace collapse,
+    up to the spacing that split() discards, via a single bytes.translate pass.
+    """
+    if text.isascii():
+        data = text.encode("ascii")
+    else:
+        # lower() first: some non-ASCII letters lowercase to ASCII (e.g. the
+        # Kelvin sign). Remaining non-ASCII code points become "?", i.e. a space.
+        data = text.lower().encode("ascii", "replace")
+    return data.translate(_ASCII_NORMALIZE).decode("ascii")
+
+
+def _clean(text: str, language: str) -> str:
+    sw = _get_stopwords(language)
+    return " ".join([tok for tok in _normalize(text).split() if tok not in sw and len(tok) > 1])
+
+
+# Cleaned output keyed by a hash of the raw text, so reruns over the same JD or
+# resumes skip normalization. Inspect with clean_text_cache.stats().
+clean_text_cache = ContentCache(weigh=len)
+
+
+def clean_text(text: str, language: str = DEFAULT_LANGUAGE) -> str:
     """Normalize text for ML pipeline."""
     if not text:
         return ""
+    return clean_text_cache.get_or_compute(text, language, lambda t: _clean(t, language))
+
 
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+def clean_texts(texts: Iterable[str], language: str = DEFAULT_LANGUAGE) -> Iterator[str]:
+    """Batch form of clean_text: yields one cleaned string per input, in order."""
+    for text in texts:
+        yield clean_text(text, language)
 
-    sw = _get_stopwords()
-    tokens = [tok for tok in text.split() if tok not in sw and len(tok) > 1]
 
-    return " ".join(tokens)
+def clean_pages(pages: Iterable[str], language: str = DEFAULT_LANGUAGE) -> str:
+    """
+    clean_text over a lazy page stream (e.g. read_resume.PageStream), one page
+    at a time, so the raw document is never held in memory as a whole. The
+    result equals clean_text of the pages joined, except for a word hyphenated
+    across a page break.
+    """
+    return " ".join(cleaned for cleaned in (_clean(page, language) for page in pages) if cleaned)
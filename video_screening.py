@@ -1,12 +1,12 @@
 import os
 import tempfile
-from typing import Dict
+from typing import Dict, Optional
 
 import speech_recognition as sr
 
+from matcher_registry import get_fitted_matcher
 from text_cleaner import clean_text
 from skill_gap import get_skill_match_details
-from svm_model import ATSMatcher
 
 try:
     from moviepy.editor import VideoFileClip
@@ -52,13 +52,15 @@ def transcribe_video_to_text(video_bytes: bytes, suffix: str = ".mp4") -> str:
                 os.remove(path)
 
 
-def screen_video_resume(video_bytes: bytes, job_description: str, video_name: str = "resume.mp4") -> Dict:
+def screen_video_resume(
+    video_bytes: bytes, job_description: str, video_name: str = "resume.mp4", config: Optional[Dict] = None
+) -> Dict:
+    """Transcribe a video resume and score it with the matcher for `config` (ATSMatcher arguments)."""
     transcript = transcribe_video_to_text(video_bytes, suffix=os.path.splitext(video_name)[1] or ".mp4")
     clean_transcript = clean_text(transcript)
     clean_jd = clean_text(job_description)
 
-    matcher = ATSMatcher()
-    matcher.fit(clean_jd)
+    matcher = get_fitted_matcher(clean_jd, config)
 
     prediction = matcher.predict_match(clean_transcript)
     skills = get_skill_match_details(clean_jd, clean_transcript)